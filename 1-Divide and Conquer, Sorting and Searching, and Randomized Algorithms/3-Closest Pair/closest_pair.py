@@ -42,6 +42,7 @@ def find_closest_pair_1d(points: List[float]) -> List[float]:
 
 
 class Point(object):
+    __slots__ = ['_x', '_y']
 
     def __init__(self, x: float, y: float):
         """
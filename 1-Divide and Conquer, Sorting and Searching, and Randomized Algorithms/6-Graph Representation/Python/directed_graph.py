@@ -18,9 +18,7 @@ class IllegalArgumentError(ValueError):
 
 class Vertex(AbstractVertex):
     __slots__ = [
-        '_freq_of_emissive_neighbors',
         '_emissive_edges',
-        '_freq_of_incident_neighbors',
         '_incident_edges'
     ]
 
@@ -30,9 +28,7 @@ class Vertex(AbstractVertex):
         :param vtx_id: int
         """
         super().__init__(vtx_id)
-        self._freq_of_emissive_neighbors = {}
         self._emissive_edges = []
-        self._freq_of_incident_neighbors = {}
         self._incident_edges = []
 
     def get_emissive_edge_with_head(self, head: AbstractVertex):
@@ -98,13 +94,9 @@ class Vertex(AbstractVertex):
             raise IllegalArgumentError('The emissive edge to add should involve'
                                        ' this vertex as the tail.')
 
+        new_emissive_edge._emissive_idx = len(self._emissive_edges)
         self._emissive_edges.append(new_emissive_edge)
 
-        emissive_neighbor = new_emissive_edge.head
-        freq = self._freq_of_emissive_neighbors.get(emissive_neighbor.vtx_id, 0)
-        freq += 1
-        self._freq_of_emissive_neighbors[emissive_neighbor.vtx_id] = freq
-
     def add_incident_edge(self, new_incident_edge) -> None:
         """
         Adds the given incident edge to this vertex
@@ -120,13 +112,9 @@ class Vertex(AbstractVertex):
             raise IllegalArgumentError('The incident edge to add should involve'
                                        ' this vertex as the head.')
 
+        new_incident_edge._incident_idx = len(self._incident_edges)
         self._incident_edges.append(new_incident_edge)
 
-        incident_neighbor = new_incident_edge.tail
-        freq = self._freq_of_incident_neighbors.get(incident_neighbor.vtx_id, 0)
-        freq += 1
-        self._freq_of_incident_neighbors[incident_neighbor.vtx_id] = freq
-
     def remove_emissive_edge(self, emissive_edge_to_remove) -> None:
         """
         Removes the given emissive edge from this vertex.
@@ -144,16 +132,20 @@ class Vertex(AbstractVertex):
                 'The emissive edge to remove should involve this vertex as the '
                 'tail.'
             )
+        # Check whether the input emissive edge exists
+        i = emissive_edge_to_remove._emissive_idx
+        if not 0 <= i < len(self._emissive_edges) or \
+                self._emissive_edges[i] is not emissive_edge_to_remove:
+            raise IllegalArgumentError(
+                "The emissive edge to remove doesn't exist."
+            )
 
-        self._emissive_edges.remove(emissive_edge_to_remove)
-
-        emissive_neighbor = emissive_edge_to_remove.head
-        freq = self._freq_of_emissive_neighbors.get(emissive_neighbor.vtx_id)
-        if freq == 1:
-            self._freq_of_emissive_neighbors.pop(emissive_neighbor.vtx_id)
-        else:
-            freq -= 1
-            self._freq_of_emissive_neighbors[emissive_neighbor.vtx_id] = freq
+        # Swap the last emissive edge into the position of the edge to
+        # remove, so that the removal doesn't need to scan the list
+        last_edge = self._emissive_edges.pop()
+        if i != len(self._emissive_edges):
+            self._emissive_edges[i] = last_edge
+            last_edge._emissive_idx = i
 
     def remove_incident_edge(self, incident_edge_to_remove) -> None:
         """
@@ -172,29 +164,54 @@ class Vertex(AbstractVertex):
                 'The incident edge to remove should involve this vertex as the '
                 'head.'
             )
+        # Check whether the input incident edge exists
+        i = incident_edge_to_remove._incident_idx
+        if not 0 <= i < len(self._incident_edges) or \
+                self._incident_edges[i] is not incident_edge_to_remove:
+            raise IllegalArgumentError(
+                "The incident edge to remove doesn't exist."
+            )
 
-        self._incident_edges.remove(incident_edge_to_remove)
-
-        incident_neighbor = incident_edge_to_remove.tail
-        freq = self._freq_of_incident_neighbors.get(incident_neighbor.vtx_id)
-        if freq == 1:
-            self._freq_of_incident_neighbors.pop(incident_neighbor.vtx_id)
-        else:
-            freq -= 1
-            self._freq_of_incident_neighbors[incident_neighbor.vtx_id] = freq
+        # Swap the last incident edge into the position of the edge to
+        # remove, so that the removal doesn't need to scan the list
+        last_edge = self._incident_edges.pop()
+        if i != len(self._incident_edges):
+            self._incident_edges[i] = last_edge
+            last_edge._incident_idx = i
 
     def __repr__(self):
+        # The frequencies of the neighbors are only shown here, so they are
+        # counted on demand rather than maintained on every edge mutation.
+        freq_of_emissive_neighbors = {}
+        for emissive_edge in self._emissive_edges:
+            head_id = emissive_edge.head.vtx_id
+            freq_of_emissive_neighbors[head_id] = \
+                freq_of_emissive_neighbors.get(head_id, 0) + 1
+        freq_of_incident_neighbors = {}
+        for incident_edge in self._incident_edges:
+            tail_id = incident_edge.tail.vtx_id
+            freq_of_incident_neighbors[tail_id] = \
+                freq_of_incident_neighbors.get(tail_id, 0) + 1
         s = f'Vertex #{self._vtx_id}\n'
-        s += f'Its emissive neighbors and frequencies: {self._freq_of_emissive_neighbors}\n'
-        s += f'Its incident neighbors and frequencies: {self._freq_of_incident_neighbors}\n'
+        s += f'Its emissive neighbors and frequencies: {freq_of_emissive_neighbors}\n'
+        s += f'Its incident neighbors and frequencies: {freq_of_incident_neighbors}\n'
         return s
 
-    def __eq__(self, other):
-        return isinstance(other, Vertex) and self._vtx_id == other.vtx_id
+    # Since the vertex IDs are unique within a graph, equality is left as
+    # identity, so that list lookups compare vertices without calling back into
+    # Python.
+    def __hash__(self):
+        return self._vtx_id
 
 
 class DirectedEdge(object):
-    __slots__ = ['_tail', '_head']
+    __slots__ = [
+        '_tail',
+        '_head',
+        '_emissive_idx',
+        '_incident_idx',
+        '_graph_idx'
+    ]
 
     def __init__(self, tail: Vertex, head: Vertex):
         """
@@ -204,6 +221,11 @@ class DirectedEdge(object):
         """
         self._tail = tail
         self._head = head
+        # Positions of this edge in the emissive edges of its tail, in the
+        # incident edges of its head, and in the edge list of the graph
+        self._emissive_idx = -1
+        self._incident_idx = -1
+        self._graph_idx = -1
 
     @property
     def tail(self) -> Vertex:
@@ -259,16 +281,18 @@ class DirectedGraph(AbstractGraph):
 
         new_vtx = Vertex(new_vtx_id)
         self._vtx_list.append(new_vtx)
+        self._vtx_map[new_vtx_id] = new_vtx
 
     def _remove_vtx(self, vtx_to_remove):
         # Remove all the edges associated with the vertex to remove
         edges_to_remove = []
         edges_to_remove.extend(vtx_to_remove.emissive_edges)
         edges_to_remove.extend(vtx_to_remove.incident_edges)
-        while len(edges_to_remove):
-            self._remove_edge(edge_to_remove=edges_to_remove[0])
+        for edge_to_remove in edges_to_remove:
+            self._remove_edge(edge_to_remove=edge_to_remove)
         # Remove the vertex
         self._vtx_list.remove(vtx_to_remove)
+        del self._vtx_map[vtx_to_remove.vtx_id]
 
     def add_edge(self, tail_id, head_id):
         # Check whether the input endpoints both exist
@@ -288,6 +312,7 @@ class DirectedGraph(AbstractGraph):
         tail, head = new_edge.tail, new_edge.head
         tail.add_emissive_edge(new_edge)
         head.add_incident_edge(new_edge)
+        new_edge._graph_idx = len(self._edge_list)
         self._edge_list.append(new_edge)
 
     def remove_edge(self, tail_id, head_id):
@@ -306,4 +331,9 @@ class DirectedGraph(AbstractGraph):
         tail, head = edge_to_remove.tail, edge_to_remove.head
         tail.remove_emissive_edge(edge_to_remove)
         head.remove_incident_edge(edge_to_remove)
-        self._edge_list.remove(edge_to_remove)
+        # Swap the last edge into the position of the edge to remove
+        i = edge_to_remove._graph_idx
+        last_edge = self._edge_list.pop()
+        if i != len(self._edge_list):
+            self._edge_list[i] = last_edge
+            last_edge._graph_idx = i
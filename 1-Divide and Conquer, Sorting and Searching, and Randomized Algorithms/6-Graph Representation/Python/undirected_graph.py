@@ -17,7 +17,7 @@ class IllegalArgumentError(ValueError):
 
 
 class Vertex(AbstractVertex):
-    __slots__ = ['_freq_of_neighbors', '_edges']
+    __slots__ = ['_edges']
 
     def __init__(self, vtx_id: int):
         """
@@ -25,7 +25,6 @@ class Vertex(AbstractVertex):
         :param vtx_id: int
         """
         super().__init__(vtx_id)
-        self._freq_of_neighbors = {}
         self._edges = []
 
     def get_edge_with_neighbor(self, neighbor: AbstractVertex):
@@ -68,18 +67,12 @@ class Vertex(AbstractVertex):
                 'The edge to add should involve this vertex.'
             )
 
+        if new_edge.end1 is self:
+            new_edge._end1_idx = len(self._edges)
+        else:
+            new_edge._end2_idx = len(self._edges)
         self._edges.append(new_edge)
 
-        # Find the neighbor associated with the input edge
-        if new_edge.end1 is self:  # endpoint2 is the neighbor.
-            neighbor = new_edge.end2
-        else:  # endpoint1 is the neighbor.
-            neighbor = new_edge.end1
-        # Update the frequency of the neighbor
-        freq = self._freq_of_neighbors.get(neighbor.vtx_id, 0)
-        freq += 1
-        self._freq_of_neighbors[neighbor.vtx_id] = freq
-
     def remove_edge(self, edge_to_remove) -> None:
         """
         Removes the given edge from this vertex.
@@ -94,28 +87,47 @@ class Vertex(AbstractVertex):
             raise IllegalArgumentError(
                 'The edge to remove should involve this vertex.'
             )
-
-        self._edges.remove(edge_to_remove)
-
-        # Find the neighbor associated with the input edge
-        if edge_to_remove.end1 is self:  # endpoint2 is the neighbor.
-            neighbor = edge_to_remove.end2
-        else:  # endpoint1 is the neighbor.
-            neighbor = edge_to_remove.end1
-        # Update the frequency of the neighbor
-        freq = self._freq_of_neighbors.get(neighbor.vtx_id)
-        if freq == 1:
-            self._freq_of_neighbors.pop(neighbor.vtx_id)
+        # Check whether the input edge exists
+        if edge_to_remove.end1 is self:
+            i = edge_to_remove._end1_idx
         else:
-            freq -= 1
-            self._freq_of_neighbors[neighbor.vtx_id] = freq
+            i = edge_to_remove._end2_idx
+        if not 0 <= i < len(self._edges) or \
+                self._edges[i] is not edge_to_remove:
+            raise IllegalArgumentError("The edge to remove doesn't exist.")
+
+        # Swap the last edge into the position of the edge to remove
+        last_edge = self._edges.pop()
+        if i != len(self._edges):
+            self._edges[i] = last_edge
+            if last_edge.end1 is self:
+                last_edge._end1_idx = i
+            else:
+                last_edge._end2_idx = i
 
     def __repr__(self):
-        return f'Vertex #{self._vtx_id}, Its neighbors and frequencies: {self._freq_of_neighbors}'
+        # The frequencies of the neighbors are only shown here, so they are
+        # counted on demand rather than maintained on every edge mutation.
+        freq_of_neighbors = {}
+        for edge in self._edges:
+            # Find the neighbor associated with the edge
+            if edge.end1 is self:  # endpoint2 is the neighbor.
+                neighbor = edge.end2
+            else:  # endpoint1 is the neighbor.
+                neighbor = edge.end1
+            freq_of_neighbors[neighbor.vtx_id] = \
+                freq_of_neighbors.get(neighbor.vtx_id, 0) + 1
+        return f'Vertex #{self._vtx_id}, Its neighbors and frequencies: {freq_of_neighbors}'
 
 
 class UndirectedEdge(object):
-    __slots__ = ['_end1', '_end2']
+    __slots__ = [
+        '_end1',
+        '_end2',
+        '_end1_idx',
+        '_end2_idx',
+        '_graph_idx'
+    ]
 
     def __init__(self, end1: Vertex, end2: Vertex):
         """
@@ -125,6 +137,11 @@ class UndirectedEdge(object):
         """
         self._end1 = end1
         self._end2 = end2
+        # Positions of this edge in the edges of its two endpoints, and in the
+        # edge list of the graph
+        self._end1_idx = -1
+        self._end2_idx = -1
+        self._graph_idx = -1
 
     @property
     def end1(self) -> Vertex:
@@ -180,6 +197,7 @@ class UndirectedGraph(AbstractGraph):
 
         new_vtx = Vertex(new_vtx_id)
         self._vtx_list.append(new_vtx)
+        self._vtx_map[new_vtx_id] = new_vtx
 
     def _remove_vtx(self, vtx_to_remove):
         # Remove all the edges associated with the vertex to remove
@@ -188,6 +206,7 @@ class UndirectedGraph(AbstractGraph):
             self._remove_edge(edge_to_remove=edges_to_remove[0])
         # Remove the vertex
         self._vtx_list.remove(vtx_to_remove)
+        del self._vtx_map[vtx_to_remove.vtx_id]
 
     def add_edge(self, end1_id, end2_id):
         # Check whether the input endpoints both exist
@@ -207,6 +226,7 @@ class UndirectedGraph(AbstractGraph):
         end1, end2 = new_edge.end1, new_edge.end2
         end1.add_edge(new_edge)
         end2.add_edge(new_edge)
+        new_edge._graph_idx = len(self._edge_list)
         self._edge_list.append(new_edge)
 
     def remove_edge(self, end1_id, end2_id):
@@ -226,4 +246,9 @@ class UndirectedGraph(AbstractGraph):
         end1, end2 = edge_to_remove.end1, edge_to_remove.end2
         end1.remove_edge(edge_to_remove)
         end2.remove_edge(edge_to_remove)
-        self._edge_list.remove(edge_to_remove)
+        # Swap the last edge into the position of the edge to remove
+        i = edge_to_remove._graph_idx
+        last_edge = self._edge_list.pop()
+        if i != len(self._edge_list):
+            self._edge_list[i] = last_edge
+            last_edge._graph_idx = i
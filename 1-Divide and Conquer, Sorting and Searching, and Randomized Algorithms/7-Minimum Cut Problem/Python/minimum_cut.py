@@ -82,43 +82,62 @@ Pr[success] >= 1 - 1/n
 __author__ = 'Ziang Lu'
 
 import math
+import random
+from typing import List, Tuple
 
 from undirected_graph import UndirectedGraph
 
 
-def _construct_undirected_graph(filename: str) -> UndirectedGraph:
+def _read_undirected_graph_info(filename: str) -> Tuple[int, List[tuple]]:
     """
-    Private helper function to construct a undirected graph from the given
-    undirected graph file.
+    Private helper function to read the number of vertices and the edges from
+    the given undirected graph file.
+    The file is parsed only once, and the parsed edges are reused to construct
+    the graph in every trial.
     :param filename: str
-    :return: UndirectedGraph
+    :return: tuple(int, list[tuple(int, int)])
     """
     with open(filename, 'rt') as f:
-        graph = UndirectedGraph()
-        # Add the vertices
         n_vtx = int(f.readline())
-        for vtx_id in range(1, n_vtx + 1):
-            graph.add_vtx(new_vtx_id=vtx_id)
-        # Add the edges
-        for line in f.readlines():
-            ends = line.split(' ')
-            graph.add_edge(end1_id=int(ends[0]), end2_id=int(ends[1]))
-        return graph
+        edges = [tuple(map(int, line.split())) for line in f if line.strip()]
+    return n_vtx, edges
+
+
+def _construct_undirected_graph(n_vtx: int,
+                                edges: List[tuple]) -> UndirectedGraph:
+    """
+    Private helper function to construct a undirected graph with the given
+    number of vertices and the given edges.
+    :param n_vtx: int
+    :param edges: list[tuple(int, int)]
+    :return: UndirectedGraph
+    """
+    graph = UndirectedGraph()
+    # Add the vertices
+    for vtx_id in range(1, n_vtx + 1):
+        graph.add_vtx(new_vtx_id=vtx_id)
+    # Add the edges
+    for end1_id, end2_id in edges:
+        graph.add_edge(end1_id=end1_id, end2_id=end2_id)
+    return graph
 
 
 def main():
+    n_vtx, edges = _read_undirected_graph_info('undirected_graph_info.txt')
     # Calculate the number of trials (n^2ln n)
-    with open('undirected_graph_info.txt', 'rt') as f:
-        n_vtx = int(f.readline())
-        n_trial = int(math.ceil(n_vtx ** 2 * math.log(n_vtx)))
-        curr_minimum_cut = len(f.readlines())
+    n_trial = int(math.ceil(n_vtx ** 2 * math.log(n_vtx)))
+    curr_minimum_cut = len(edges)
 
-    for i in range(n_trial):
-        # Construct the graph
-        graph = _construct_undirected_graph('undirected_graph_info.txt')
+    # Construct the graph
+    # Since computing a minimum cut with union-find doesn't modify the graph,
+    # the graph only needs to be constructed once for all the trials.
+    graph = _construct_undirected_graph(n_vtx, edges=edges)
 
+    # Share a single random number generator across all the trials
+    rng = random.Random()
+    for i in range(n_trial):
         # Compute a minimum cut
-        minimum_cut = graph.compute_minimum_cut()
+        minimum_cut = graph.compute_minimum_cut_with_union_find(rng)
         if minimum_cut < curr_minimum_cut:
             curr_minimum_cut = minimum_cut
     print(f'Minimum cut: {curr_minimum_cut}')  # 2
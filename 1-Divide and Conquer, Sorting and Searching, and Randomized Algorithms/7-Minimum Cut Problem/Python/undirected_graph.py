@@ -10,6 +10,7 @@ Note that parallel edges are allowed, but not self-loops.
 __author__ = 'Ziang Lu'
 
 import random
+from array import array
 
 from graph_basics import AbstractGraph, AbstractVertex
 
@@ -19,7 +20,7 @@ class IllegalArgumentError(ValueError):
 
 
 class Vertex(AbstractVertex):
-    __slots__ = ['_freq_of_neighbors', '_edges']
+    __slots__ = ['_edges']
 
     def __init__(self, vtx_id: int):
         """
@@ -27,8 +28,9 @@ class Vertex(AbstractVertex):
         :param vtx_id: int
         """
         super().__init__(vtx_id)
-        self._freq_of_neighbors = {}
-        self._edges = []
+        # Edges are keyed by their identities, so that removing an edge is O(1)
+        # rather than a linear scan.
+        self._edges = {}
 
     def get_edge_with_neighbor(self, neighbor: AbstractVertex):
         """
@@ -40,7 +42,7 @@ class Vertex(AbstractVertex):
         if not neighbor:
             raise IllegalArgumentError('The input neighbor should not be None.')
 
-        for edge in self._edges:
+        for edge in self._edges.values():
             if (edge.end1 is self and edge.end2 is neighbor) or \
                     (edge.end1 is neighbor and edge.end2 is self):
                 return edge
@@ -48,12 +50,12 @@ class Vertex(AbstractVertex):
         return None
 
     @property
-    def edges(self) -> list:
+    def edges(self):
         """
         Accessor of edges.
-        :return: list[UndirectedEdge]
+        :return: ValuesView[UndirectedEdge]
         """
-        return self._edges
+        return self._edges.values()
 
     def add_edge(self, new_edge) -> None:
         """
@@ -70,17 +72,7 @@ class Vertex(AbstractVertex):
                 'The edge to add should involve this vertex.'
             )
 
-        self._edges.append(new_edge)
-
-        # Find the neighbor associated with the input edge
-        if new_edge.end1 is self:  # endpoint2 is the neighbor.
-            neighbor = new_edge.end2
-        else:  # endpoint1 is the neighbor.
-            neighbor = new_edge.end1
-        # Update the frequency of the neighbor
-        freq = self._freq_of_neighbors.get(neighbor.vtx_id, 0)
-        freq += 1
-        self._freq_of_neighbors[neighbor.vtx_id] = freq
+        self._edges[id(new_edge)] = new_edge
 
     def remove_edge(self, edge_to_remove) -> None:
         """
@@ -97,27 +89,34 @@ class Vertex(AbstractVertex):
                 'The edge to remove should involve this vertex.'
             )
 
-        self._edges.remove(edge_to_remove)
-
-        # Find the neighbor associated with the input edge
-        if edge_to_remove.end1 is self:  # endpoint2 is the neighbor.
-            neighbor = edge_to_remove.end2
-        else:  # endpoint1 is the neighbor.
-            neighbor = edge_to_remove.end1
-        # Update the frequency of the neighbor
-        freq = self._freq_of_neighbors.get(neighbor.vtx_id)
-        if freq == 1:
-            self._freq_of_neighbors.pop(neighbor.vtx_id)
-        else:
-            freq -= 1
-            self._freq_of_neighbors[neighbor.vtx_id] = freq
+        del self._edges[id(edge_to_remove)]
+
+    def absorb_edges(self, other) -> None:
+        """
+        Adds all the edges of the given vertex to this vertex in one batch, after
+        those edges have been reformed to involve this vertex.
+        :param other: Vertex
+        :return: None
+        """
+        self._edges.update(other._edges)
 
     def __repr__(self):
-        return f'Vertex #{self._vtx_id}, Its neighbors and frequencies: {self._freq_of_neighbors}'
+        # The frequencies of the neighbors are only shown here, so they are
+        # counted on demand rather than maintained on every edge mutation.
+        freq_of_neighbors = {}
+        for edge in self._edges.values():
+            # Find the neighbor associated with the edge
+            if edge.end1 is self:  # endpoint2 is the neighbor.
+                neighbor = edge.end2
+            else:  # endpoint1 is the neighbor.
+                neighbor = edge.end1
+            freq_of_neighbors[neighbor.vtx_id] = \
+                freq_of_neighbors.get(neighbor.vtx_id, 0) + 1
+        return f'Vertex #{self._vtx_id}, Its neighbors and frequencies: {freq_of_neighbors}'
 
 
 class UndirectedEdge(object):
-    __slots__ = ['_end1', '_end2']
+    __slots__ = ['_end1', '_end2', '_graph_idx']
 
     def __init__(self, end1: Vertex, end2: Vertex):
         """
@@ -127,6 +126,8 @@ class UndirectedEdge(object):
         """
         self._end1 = end1
         self._end2 = end2
+        # Position of this edge in the edge list of the graph
+        self._graph_idx = -1
 
     @property
     def end1(self) -> Vertex:
@@ -182,14 +183,16 @@ class UndirectedGraph(AbstractGraph):
 
         new_vtx = Vertex(new_vtx_id)
         self._vtx_list.append(new_vtx)
+        self._vtx_map[new_vtx_id] = new_vtx
 
     def _remove_vtx(self, vtx_to_remove):
         # Remove all the edges associated with the vertex to remove
         edges_to_remove = vtx_to_remove.edges
         while len(edges_to_remove):
-            self._remove_edge(edge_to_remove=edges_to_remove[0])
+            self._remove_edge(edge_to_remove=next(iter(edges_to_remove)))
         # Remove the vertex
         self._vtx_list.remove(vtx_to_remove)
+        del self._vtx_map[vtx_to_remove.vtx_id]
 
     def add_edge(self, end1_id, end2_id):
         # Check whether the input endpoints both exist
@@ -211,6 +214,7 @@ class UndirectedGraph(AbstractGraph):
         end1, end2 = new_edge.end1, new_edge.end2
         end1.add_edge(new_edge)
         end2.add_edge(new_edge)
+        new_edge._graph_idx = len(self._edge_list)
         self._edge_list.append(new_edge)
 
     def remove_edge(self, end1_id, end2_id):
@@ -230,7 +234,12 @@ class UndirectedGraph(AbstractGraph):
         end1, end2 = edge_to_remove.end1, edge_to_remove.end2
         end1.remove_edge(edge_to_remove)
         end2.remove_edge(edge_to_remove)
-        self._edge_list.remove(edge_to_remove)
+        # Swap the last edge into the position of the edge to remove
+        i = edge_to_remove._graph_idx
+        last_edge = self._edge_list.pop()
+        if i != len(self._edge_list):
+            self._edge_list[i] = last_edge
+            last_edge._graph_idx = i
 
     def remove_edges_between_pair(self, end1_id: int, end2_id: int) -> None:
         """
@@ -239,24 +248,36 @@ class UndirectedGraph(AbstractGraph):
         :param end2_id: int
         :return: None
         """
-        try:
-            while True:
-                self.remove_edge(end1_id=end1_id, end2_id=end2_id)
-        except IllegalArgumentError:
-            pass
+        # Look up the endpoints only once, rather than once per parallel edge
+        end1, end2 = self._find_vtx(end1_id), self._find_vtx(end2_id)
+        if not end1 or not end2:
+            return
+
+        # Collect all the edges between the pair in a single scan
+        edges_to_remove = [
+            edge for edge in end1.edges if edge.end1 is end2 or edge.end2 is end2
+        ]
+        for edge_to_remove in edges_to_remove:
+            self._remove_edge(edge_to_remove=edge_to_remove)
 
-    def compute_minimum_cut(self) -> int:
+    def compute_minimum_cut(self, rng: random.Random = None) -> int:
         """
         Computes a cut with the fewest number of crossing edges.
+        :param rng: Random
         :return: int
         """
+        randrange = rng.randrange if rng else random.randrange
         if len(self._vtx_list) <= 1:
             return 0
 
         # While there are more than 2 vertices
         while len(self._vtx_list) > 2:
             # 1. Pick up an edge randomly
-            random_idx = random.randint(0, len(self._edge_list) - 1)
+            # Parallel edges are kept as separate entries in the edge list, so
+            # picking a uniformly random index already samples each pair of
+            # super-vertices in proportion to the number of edges between
+            # them, in O(1) and without any cumulative weights.
+            random_idx = randrange(len(self._edge_list))
             edge_to_contract = self._edge_list[random_idx]
             end1, end2 = edge_to_contract.end1, edge_to_contract.end2
 
@@ -275,13 +296,74 @@ class UndirectedGraph(AbstractGraph):
             self._reconnect_edges(end=end2, merged_vtx=merged_vtx)
         return len(self._edge_list)
 
+    def compute_minimum_cut_with_union_find(self,
+                                            rng: random.Random = None) -> int:
+        """
+        Computes a cut with the fewest number of crossing edges, without
+        modifying this graph.
+        Rather than physically contracting the vertices and reconnecting the
+        edges, each merged vertex is represented by a group in a union-find over
+        the vertex indices, and an edge becomes a self-loop exactly when its two
+        endpoints are in the same group.
+        Since the loop only deals with integer indices, one trial costs nearly
+        O(m) instead of O(n * m), and the same graph can be reused across
+        trials.
+        The endpoints are stored interleaved in a flat array('i'), where the
+        i-th edge is (ends[2i], ends[2i + 1]), so that the loop works on
+        contiguous machine integers rather than boxed Python objects.
+        Callers running many trials should share a single Random instance
+        across the trials.
+        :param rng: Random
+        :return: int
+        """
+        n_vtx = len(self._vtx_list)
+        if n_vtx <= 1:
+            return 0
+        # random() is implemented in C, while randrange() goes through several
+        # Python-level calls, so scaling a random float is much cheaper.
+        rand = rng.random if rng else random.random
+
+        idx_of_vtx = {vtx.vtx_id: i for i, vtx in enumerate(self._vtx_list)}
+        ends = array('i')
+        for edge in self._edge_list:
+            ends.append(idx_of_vtx[edge.end1.vtx_id])
+            ends.append(idx_of_vtx[edge.end2.vtx_id])
+        parents = array('i', range(n_vtx))
+
+        def find(i: int) -> int:
+            # Path halving
+            while parents[i] != i:
+                parents[i] = parents[parents[i]]
+                i = parents[i]
+            return i
+
+        n_edge, n_group = len(ends) // 2, n_vtx
+        # While there are more than 2 vertices
+        while n_group > 2 and n_edge:
+            # 1. Pick up an edge randomly
+            i = 2 * int(rand() * n_edge)
+            root1, root2 = find(ends[i]), find(ends[i + 1])
+            # 2. Contract the two endpoints into a single vertex
+            if root1 != root2:
+                parents[root1] = root2
+                n_group -= 1
+            # Either way, the picked edge is now a self-loop, so discard it by
+            # moving the last remaining edge into its slot.
+            n_edge -= 1
+            ends[i], ends[i + 1] = ends[2 * n_edge], ends[2 * n_edge + 1]
+        # The remaining edges that are not self-loops are the crossing edges.
+        return sum(
+            1 for i in range(0, 2 * n_edge, 2)
+            if find(ends[i]) != find(ends[i + 1])
+        )
+
     def _get_next_vtx_id(self) -> int:
         """
         Private helper function to get the next available vertex ID, which is 1
         greater than the current largest vertex ID.
         :return: int
         """
-        return max(vtx.id for vtx in self._vtx_list) + 1
+        return max(vtx.vtx_id for vtx in self._vtx_list) + 1
 
     def _reconnect_edges(self, end: Vertex, merged_vtx: Vertex) -> None:
         """
@@ -292,19 +374,15 @@ class UndirectedGraph(AbstractGraph):
         :return: None
         """
         for edge_from_end in end.edges:
-            # Find the neighbor
+            # Reform the edge to connect the neighbor and the merged vertex
             if edge_from_end.end1 is end:  # endpoint2 is the neighbor.
-                neighbor = edge_from_end.end2
-                # Remove the dge from the neighbor
-                neighbor.remove_edge(edge_to_remove=edge_from_end)
-                # Reform the edge to connect the neighbor and the merged vertex
                 edge_from_end.end1 = merged_vtx
             else:  # endpoint1 is the neighbor.
-                neighbor = edge_from_end.end1
-                neighbor.remove_edge(edge_to_remove=edge_from_end)
                 edge_from_end.end2 = merged_vtx
-            # add the new edge to both the neighbor and the merged vertex
-            neighbor.add_edge(edge_from_end)
-            merged_vtx.add_edge(edge_from_end)
+        # Rather than removing and re-adding the reformed edges one by one, add
+        # all the reformed edges to the merged vertex in one batch.
+        # (The neighbors keep the same edge objects, so they need no update.)
+        merged_vtx.absorb_edges(end)
         # Remove the endpoint
         self._vtx_list.remove(end)
+        del self._vtx_map[end.vtx_id]
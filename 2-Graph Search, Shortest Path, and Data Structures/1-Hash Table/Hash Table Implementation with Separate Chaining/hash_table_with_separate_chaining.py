@@ -8,8 +8,6 @@ lowercase words to their frequencies.
 
 __author__ = 'Ziang Lu'
 
-import hashlib
-import math
 import re
 from typing import List
 
@@ -57,9 +55,12 @@ class DataItem(object):
 
 
 class HTWithSC(object):
-    __slots__ = ['_md5', '_data', '_n_item']
+    __slots__ = ['_shift', '_data', '_n_item']
 
     _LOAD_FACTOR = 5.0
+    # 2^64 / golden ratio, used for Fibonacci hashing
+    _FIB_MULTIPLIER = 0x9E3779B97F4A7C15
+    _MASK_64 = 0xFFFFFFFFFFFFFFFF
 
     @staticmethod
     def _initialize_data(capacity: int) -> List[list]:
@@ -80,27 +81,11 @@ class HTWithSC(object):
         lower_word_regex = re.compile('^[a-z]+$')
         return text is not None and lower_word_regex.match(text)
 
-    @staticmethod
-    def _is_prime(n: int) -> bool:
-        """
-        Determines whether the given number is prime.
-        :param n: int
-        :return: bool
-        """
-        if n <= 1:
-            return False
-        if n == 2:
-            return True
-        if n % 2 == 0:
-            return False
-        for i in range(3, int(math.sqrt(n)), 2):
-            if n % i == 0:
-                return False
-        return True
-
     def __init__(self, initial_capacity=10):
         """
         Constructor with parameter.
+        Note that the capacity is rounded up to the next power of 2, as required
+        by Fibonacci hashing.
         :param initial_capacity: int
         """
         # Check whether the input initial capacity is positive
@@ -109,8 +94,9 @@ class HTWithSC(object):
                 'The initial capacity should be positive.'
             )
 
-        self._md5 = hashlib.md5()
-        self._data = self._initialize_data(initial_capacity)
+        capacity = 1 << (initial_capacity - 1).bit_length()
+        self._shift = 64 - (capacity.bit_length() - 1)
+        self._data = self._initialize_data(capacity)
         self._n_item = 0
 
     def hash_value(self, text: str) -> int:
@@ -123,8 +109,11 @@ class HTWithSC(object):
         if not self._is_lower_word(text):
             return -1
 
-        self._md5.update(text.encode('utf-8'))
-        return int(self._md5.hexdigest(), base=16) % len(self._data)
+        # Fibonacci hashing:
+        # Scramble the built-in string hash with a 64-bit multiplication, and
+        # take the top log2(capacity) bits as the bucket index.
+        return ((hash(text) * self._FIB_MULTIPLIER) & self._MASK_64) >> \
+            self._shift
 
     def size(self) -> int:
         """
@@ -182,25 +171,14 @@ class HTWithSC(object):
         # reference between two lists
         # Temporarily store the original list
         tmp = self._data
-        # Create the new list
-        new_size = self._find_next_prime(start=len(self._data) * 2 + 1)
-        self._data = self._initialize_data(capacity=new_size)
+        # Create the new list, doubling the capacity
+        self._shift -= 1
+        self._data = self._initialize_data(capacity=len(tmp) * 2)
         for chaining in tmp:
             for item in chaining:
                 hash_val = self.hash_value(item.data)
                 self._data[hash_val].append(item)
 
-    def _find_next_prime(self, start: int) -> int:
-        """
-        Helper function to find the next prime starting from the given number.
-        :param start: int
-        :return: int
-        """
-        n = start
-        while not self._is_prime(n):
-            n += 1
-        return n
-
     def remove(self, text: str) -> str:
         """
         Removes the given text from the hash table.
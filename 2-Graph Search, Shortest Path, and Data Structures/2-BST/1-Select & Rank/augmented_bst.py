@@ -11,81 +11,34 @@ The two sub-problems are mutually reverse problems.
 
 __author__ = 'Ziang Lu'
 
+from bisect import bisect_left
+from typing import List
+
 
 class Node:
-    __slots__ = ['_key', '_left', '_right', '_size']
+    __slots__ = ['key', 'left', 'right', 'size']
 
     def __init__(self, key: int):
         """
         Constructor with parameter.
         :param key: int
         """
-        self._key = key
-        self._left = None
-        self._right = None
-        self._size = 1
-
-    @property
-    def key(self) -> int:
-        """
-        Accessor of key.
-        :return: int
-        """
-        return self._key
-
-    @property
-    def left(self):
-        """
-        Accessor of left.
-        :return: Node
-        """
-        return self._left
-
-    @property
-    def right(self):
-        """
-        Accessor of right.
-        :return: Node
-        """
-        return self._right
-
-    @property
-    def size(self) -> int:
-        """
-        Accessor of size.
-        :return: int
-        """
-        return self._size
-
-    @left.setter
-    def left(self, left) -> None:
-        """
-        Mutator of left.
-        :param left: Node
-        :return: None
-        """
-        self._left = left
+        self.key = key
+        self.left = NIL
+        self.right = NIL
+        self.size = 1
 
-    @right.setter
-    def right(self, right) -> None:
-        """
-        Mutator of right.
-        :param right: Node
-        :return: None
-        """
-        self._right = right
+    def __repr__(self):
+        return f'[{self.key}, size: {self.size}]'
 
-    @size.setter
-    def size(self, size: int) -> None:
-        """
-        Mutator of size.
-        :param size: int
-        :return: None
-        """
-        self._size = size
 
-    def __repr__(self):
-        return f'[{self._key}, size: {self._size}]'
+# Sentinel node standing for every empty sub-tree.
+# Since its size is 0, the size of the left child of a node can always be read
+# directly, without checking whether the left child exists.
+NIL = Node.__new__(Node)
+NIL.key = None
+NIL.left = NIL.right = NIL
+NIL.size = 0
 
 
 class AugmentedBST:
@@ -94,40 +47,121 @@ class AugmentedBST:
     A simple BST class, but each node has an additional data field: the number
     of nodes in the sub-tree rooted at that node.
     """
-    __slots__ = ['_root']
+    __slots__ = ['_root', '_sorted_keys']
 
     def __init__(self):
         """
         Default constructor.
         """
-        self._root = None
-
-    def search(self, key: int) -> bool:
+        self._root = NIL
+        # Sorted keys of the BST when frozen, or None otherwise
+        self._sorted_keys = None
+
+    @classmethod
+    def from_sorted(cls, keys: List[int]):
+        """
+        Builds an augmented BST from the given sorted keys in linear time.
+        (If the keys turn out to be unsorted, they are sorted first in
+        O(nlog n).)
+        :param keys: list[int]
+        :return: AugmentedBST
+        """
+        bst = cls()
+        # Drop the duplicate keys in the same linear pass that checks the
+        # order, and only sort (O(nlog n)) if the keys are unsorted
+        unique_keys = []
+        for key in keys:
+            if unique_keys and key <= unique_keys[-1]:
+                if key < unique_keys[-1]:  # Unsorted after all
+                    unique_keys = sorted(set(keys))
+                    break
+                continue  # Duplicate
+            unique_keys.append(key)
+        bst._root = cls._build_balanced(
+            unique_keys, lo=0, hi=len(unique_keys)
+        )
+        return bst
+
+    @staticmethod
+    def _build_balanced(keys: List[int], lo: int, hi: int) -> Node:
+        """
+        Private helper function to build a perfectly balanced subtree from the
+        given sorted keys in [lo, hi) recursively.
+        :param keys: list[int]
+        :param lo: int
+        :param hi: int
+        :return: Node
         """
-        Searches for the given key in this BST.
+        # Base case
+        if lo >= hi:
+            return NIL
+        # Recursive case
+        mid = (lo + hi) // 2
+        node = Node(keys[mid])
+        node.left = AugmentedBST._build_balanced(keys, lo=lo, hi=mid)
+        node.right = AugmentedBST._build_balanced(keys, lo=mid + 1, hi=hi)
+        node.size = hi - lo
+        return node
+        # T(n) = 2T(n/2) + O(1)
+        # a = 2, b = 2, d = 0
+        # According to Master Method, time: O(n)
+
+    def freeze(self) -> None:
+        """
+        Flattens the BST into a sorted array of keys for read-heavy workloads.
+        Until the next successful insertion, select() becomes a single array
+        access, and search() and get_rank() become a binary search over
+        contiguous memory, rather than chasing references through the nodes.
+        :return: None
+        """
+        sorted_keys = []
+        stack, curr = [], self._root
+        while stack or curr is not NIL:
+            # Go all the way left, and then visit the node and go right
+            while curr is not NIL:
+                stack.append(curr)
+                curr = curr.left
+            curr = stack.pop()
+            sorted_keys.append(curr.key)
+            curr = curr.right
+        self._sorted_keys = sorted_keys
+        # Time: O(n)
+
+    def _find_in_sorted_keys(self, key: int) -> int:
+        """
+        Private helper function to find the index of the given key in the
+        sorted keys of the frozen BST.
         :param key: int
-        :return: bool
+        :return: int
         """
-        return self._search_helper(key, self._root)
+        idx = bisect_left(self._sorted_keys, key)
+        if idx < len(self._sorted_keys) and self._sorted_keys[idx] == key:
+            return idx
+        # Not found
+        return -1
+        # Time: O(log n)
 
-    def _search_helper(self, key: int, curr: Node) -> bool:
+    def search(self, key: int) -> bool:
         """
-        Private helper function to search for the given key in the given
-        sub-tree recursively.
+        Searches for the given key in this BST.
         :param key: int
-        :param curr: Node
         :return: bool
         """
-        # Base case 1: Not found
-        if not curr:
-            return False
-        # Base case 2: Found it
-        if curr.key == key:
-            return True
-
-        # Recursive case
-        return self._search_helper(key, curr.left) or \
-            self._search_helper(key, curr.right)
+        if self._sorted_keys is not None:
+            return self._find_in_sorted_keys(key) != -1
+        curr = self._root
+        while curr is not NIL:
+            curr_key = curr.key
+            if curr_key == key:
+                # Found it
+                return True
+            if curr_key > key:
+                curr = curr.left
+            else:
+                curr = curr.right
+        # Not found
+        return False
+        # Time: O(log n)
 
     def insert(self, key: int) -> bool:
         """
@@ -135,44 +169,48 @@ class AugmentedBST:
         :param key: int
         :return: bool
         """
-        if not self._root:
+        if self._root is NIL:
             self._root = Node(key)
+            self._sorted_keys = None
             return True
 
-        return self._insert_helper(key, parent=None, curr=self._root,
-                                   is_lc=True)
+        inserted = self._insert_helper(key)
+        if inserted:
+            # The flattened keys are now stale.
+            self._sorted_keys = None
+        return inserted
 
-    def _insert_helper(self, key: int, parent: Node, curr: Node,
-                       is_lc: bool) -> bool:
+    def _insert_helper(self, key: int) -> bool:
         """
-        Private helper function to insert the given key to the given sub-tree
-        recursively.
+        Private helper function to insert the given key to the BST iteratively.
         :param key: int
-        :param parent: Node
-        :param curr: Node
-        :param is_lc: bool
         :return: bool
         """
-        # Base case 1: Found the spot to insert
-        if not curr:
-            if is_lc:
-                parent.left = Node(key)
+        # Go down to find the spot to insert, recording the path
+        path = []
+        curr = self._root
+        while curr is not NIL:
+            curr_key = curr.key
+            if curr_key == key:
+                # No duplicate allowed
+                return False
+            path.append(curr)
+            if curr_key > key:
+                curr = curr.left
             else:
-                parent.right = Node(key)
-            return True
-        # Base case 2: Found it
-        if curr.key == key:
-            # No duplicate allowed
-            return False
+                curr = curr.right
 
-        curr.size += 1
-        # Recursive case
-        if curr.key > key:
-            return self._insert_helper(key, parent=curr, curr=curr.left,
-                                       is_lc=True)
+        parent = path[-1]
+        if parent.key > key:
+            parent.left = Node(key)
         else:
-            return self._insert_helper(key, parent=curr, curr=curr.right,
-                                       is_lc=False)
+            parent.right = Node(key)
+        # Only now that the key is known to be new, update the sizes of the
+        # nodes along the path
+        for node in path:
+            node.size += 1
+        return True
+        # Time: O(log n)
 
     def traverse_in_order(self) -> None:
         """
@@ -180,23 +218,42 @@ class AugmentedBST:
         :return: str
         """
         s = self._traverse_in_order_helper(self._root)
-        print(s.strip())
+        print(s)
 
     def _traverse_in_order_helper(self, curr: Node) -> str:
         """
         Private helper function to traverse the given sub-tree in-order
-        recursively.
+        iteratively, using Morris traversal.
+        Rather than using a stack, the right link of the in-order predecessor of
+        each node is temporarily threaded back to the node, so that we can
+        return to the node after traversing its left sub-tree, and the thread is
+        removed on the way back.  Thus only O(1) extra space is used, and the
+        tree is left unchanged afterwards.
         :param curr: Node
         :return: str
         """
-        # Base case
-        if not curr:
-            return ''
-        # Recursive case
-        s = self._traverse_in_order_helper(curr.left)
-        s += str(curr) + ' '
-        s += self._traverse_in_order_helper(curr.right)
-        return s
+        parts = []
+        while curr is not NIL:
+            if curr.left is NIL:
+                parts.append(repr(curr))
+                curr = curr.right
+                continue
+            # Find the in-order predecessor of the current node
+            pre = curr.left
+            while pre.right is not NIL and pre.right is not curr:
+                pre = pre.right
+            if pre.right is NIL:
+                # Thread the predecessor back to the current node, and go left
+                pre.right = curr
+                curr = curr.left
+            else:
+                # Back from the left sub-tree: remove the thread, and then visit
+                # the current node and go right
+                pre.right = NIL
+                parts.append(repr(curr))
+                curr = curr.right
+        return ' '.join(parts)
+        # Time: O(n)
 
     def select(self, rank: int) -> int:
         """
@@ -205,41 +262,38 @@ class AugmentedBST:
         :return: int
         """
         # Check whether the BST is empty
-        if not self._root:
+        if self._root is NIL:
             raise ValueError('The BST is empty.')
         # Check whether the input ranking is out of range
         n_node = self._root.size
         if rank <= 0 or rank > n_node:
             raise ValueError('The input ranking is out of range.')
 
+        if self._sorted_keys is not None:
+            return self._sorted_keys[rank - 1]
         return self._select_helper(rank, curr=self._root)
 
     def _select_helper(self, rank: int, curr: Node) -> int:
         """
         Private helper function to find the key with the given ranking in the
-        given sub-tree recursively.
+        given sub-tree iteratively.
         :param rank: int
         :param curr: Node
         :return: int
         """
-        left_size = 0
-        if curr.left:
-            left_size = curr.left.size
-        curr_rank_in_subtree = left_size + 1
-        # Base case
-        if curr_rank_in_subtree == rank:
-            return curr.key
+        while True:
+            curr_rank_in_subtree = curr.left.size + 1
+            if curr_rank_in_subtree == rank:
+                return curr.key
 
-        # Recursive case
-        if curr_rank_in_subtree > rank:
-            return self._select_helper(rank, curr.left)
-        else:
-            # Note that the rank in the right sub-tree is
-            # (rank - curr_rank_in_subtree)
-            return self._select_helper(rank - curr_rank_in_subtree, curr.right)
-        # T(n) = T(n/2) + O(1)
-        # a = 1, b = 2, d = 0
-        # According to Master Method, time: O(log n)
+            if curr_rank_in_subtree > rank:
+                curr = curr.left
+            else:
+                # Note that the rank in the right sub-tree is
+                # (rank - curr_rank_in_subtree)
+                rank -= curr_rank_in_subtree
+                curr = curr.right
+        # Time: O(log n)
 
     def get_rank(self, key: int) -> int:
         """
@@ -247,34 +301,35 @@ class AugmentedBST:
         :param key: int
         :return: int
         """
+        if self._sorted_keys is not None:
+            idx = self._find_in_sorted_keys(key)
+            return idx + 1 if idx != -1 else -1
         return self._get_rank_helper(key, self._root)
 
     def _get_rank_helper(self, key: int, curr: Node) -> int:
         """
         Private helper function to find the ranking of the given key in the
-        given sub-tree recursively.
+        given sub-tree iteratively.
         :param key: int
         :param curr: Node
         :return: int
         """
-        # Base case 1: Not found
-        if not curr:
-            return -1
-        left_size = 0
-        if curr.left:
-            left_size = curr.left.size
-        curr_rank_in_subtree = left_size + 1
-        # Base case 2: Found it
-        if curr.key == key:
-            return curr_rank_in_subtree
-
-        # Recursive case
-        if curr.key > key:
-            return self._get_rank_helper(key, curr.left)
-        else:
-            # Note that the rank in the right sub-tree is
-            # (rank - curr_rank_in_subtree)
-            return curr_rank_in_subtree + self._get_rank_helper(key, curr.right)
-        # T(n) = T(n/2) + O(1)
-        # a = 1, b = 2, d = 0
-        # According to Master Method, time: O(log n)
+        # Number of keys smaller than the current sub-tree
+        n_smaller = 0
+        while curr is not NIL:
+            curr_rank_in_subtree = curr.left.size + 1
+            curr_key = curr.key
+            if curr_key == key:
+                # Found it
+                return n_smaller + curr_rank_in_subtree
+
+            if curr_key > key:
+                curr = curr.left
+            else:
+                # Note that all the keys in the left sub-tree and the current
+                # key are smaller than the keys in the right sub-tree.
+                n_smaller += curr_rank_in_subtree
+                curr = curr.right
+        # Not found
+        return -1
+        # Time: O(log n)
@@ -14,88 +14,42 @@ from typing import List
 
 
 class Node(object):
-    __slots__ = ['_key', '_left', '_right', '_height']
+    __slots__ = ['key', 'left', 'right', 'height', 'balance']
 
     def __init__(self, key: int):
         """
         Constructor with parameter.
         :param key: int
         """
-        self._key = key
-        self._left = None
-        self._right = None
-        self._height = 1
-
-    @property
-    def key(self) -> int:
-        """
-        Accessor of key.
-        :return: int
-        """
-        return self._key
-
-    @property
-    def left(self):
-        """
-        Accessor of left.
-        :return: Node
-        """
-        return self._left
-
-    @property
-    def right(self):
-        """
-        Accessor of right.
-        :return: Node
-        """
-        return self._right
-
-    @property
-    def height(self) -> int:
-        """
-        Accessor of height.
-        :return: int
-        """
-        return self._height
-
-    @left.setter
-    def left(self, left) -> None:
-        """
-        Mutator of left.
-        :param left: Node
-        :return: None
-        """
-        self._left = left
-
-    @right.setter
-    def right(self, right) -> None:
-        """
-        Mutator of right.
-        :param right: Node
-        :return: None
-        """
-        self._right = right
+        self.key = key
+        self.left = None
+        self.right = None
+        self.height = 1
+        # Height of the left subtree minus that of the right subtree
+        self.balance = 0
 
     def update_height(self) -> None:
         """
-        Updates the height of this node.
+        Updates the height, as well as the balance, of this node.
         :return: None
         """
         left_height, right_height = 0, 0
-        if self._left:
-            left_height = self._left.height
-        if self._right:
-            right_height = self._right.height
-        self._height = 1 + max(left_height, right_height)
+        if self.left:
+            left_height = self.left.height
+        if self.right:
+            right_height = self.right.height
+        self.height = 1 + max(left_height, right_height)
+        self.balance = left_height - right_height
 
 
 class AVLTree(object):
-    __slots__ = ['_root']
+    __slots__ = ['_root', '_path', '_balanced']
 
     @staticmethod
     def _right_rotate(unbalanced: Node) -> Node:
         """
-        Makes a right rotation towards the given unbalanced node.
+        Makes a right rotation towards the given unbalanced node, and updates
+        the heights of the two nodes involved in the same pass.
         :param unbalanced: Node
         :return: Node
         """
@@ -103,16 +57,21 @@ class AVLTree(object):
         tmp = unbalanced.left
 
         # Reconnect the references to realize right rotation
-        unbalanced.left = unbalanced.left.right
+        unbalanced.left = tmp.right
         tmp.right = unbalanced
 
+        # The unbalanced node is now a child of tmp, so it must be updated
+        # first.
+        unbalanced.update_height()
+        tmp.update_height()
         return tmp
         # Running time complexity: O(1)
 
     @staticmethod
     def _left_rotate(unbalanced: Node) -> Node:
         """
-        Makes a left rotation towards the given unbalanced node.
+        Makes a left rotation towards the given unbalanced node, and updates
+        the heights of the two nodes involved in the same pass.
         :param unbalanced: Node
         :return: Node
         """
@@ -120,9 +79,13 @@ class AVLTree(object):
         tmp = unbalanced.right
 
         # Reconnect the references to realize left rotation
-        unbalanced.right = unbalanced.right.left
+        unbalanced.right = tmp.left
         tmp.left = unbalanced
 
+        # The unbalanced node is now a child of tmp, so it must be updated
+        # first.
+        unbalanced.update_height()
+        tmp.update_height()
         return tmp
         # Running time complexity: O(1)
 
@@ -131,38 +94,82 @@ class AVLTree(object):
         Default constructor.
         """
         self._root = None
+        # Path from the root used by insertions, reused across calls to avoid
+        # allocating a new list for each insertion
+        self._path = []
+        # Whether the AVL invariant holds, which is broken by lazy insertions
+        # until the next rebalance_all()
+        self._balanced = True
+
+    @classmethod
+    def from_sorted(cls, keys: List[int]):
+        """
+        Builds an AVL-Tree from the given sorted keys in linear time, without
+        any rotation.
+        (If the keys turn out to be unsorted, they are sorted first in
+        O(nlog n).)
+        :param keys: list[int]
+        :return: AVLTree
+        """
+        tree = cls()
+        # Skip the adjacent duplicates in one linear pass, falling back to
+        # sorting the distinct keys (O(nlog n)) if any key is out of order
+        unique_keys = []
+        for key in keys:
+            if unique_keys and key <= unique_keys[-1]:
+                if key < unique_keys[-1]:  # Unsorted after all
+                    unique_keys = sorted(set(keys))
+                    break
+                continue  # Duplicate
+            unique_keys.append(key)
+        tree._root = cls._build_balanced(
+            unique_keys, lo=0, hi=len(unique_keys)
+        )
+        return tree
 
-    def search(self, key: int) -> bool:
+    @staticmethod
+    def _build_balanced(keys: List[int], lo: int, hi: int) -> Node:
         """
-        Searches for the given key in this BST.
-        :param key: int
-        :return: bool
+        Private helper function to build a perfectly balanced subtree from the
+        given sorted keys in [lo, hi) recursively.
+        :param keys: list[int]
+        :param lo: int
+        :param hi: int
+        :return: Node
         """
-        return self._search_helper(key, self._root)
+        # Base case
+        if lo >= hi:
+            return None
+        # Recursive case
+        mid = (lo + hi) // 2
+        node = Node(keys[mid])
+        node.left = AVLTree._build_balanced(keys, lo=lo, hi=mid)
+        node.right = AVLTree._build_balanced(keys, lo=mid + 1, hi=hi)
+        node.update_height()
+        return node
+        # T(n) = 2T(n/2) + O(1)
+        # a = 2, b = 2, d = 0
+        # According to Master Method, time: O(n)
 
-    def _search_helper(self, key: int, curr: Node) -> bool:
+    def search(self, key: int) -> bool:
         """
-        Private helper function to search for the given key in the given subtree
-        recursively.
+        Searches for the given key in this BST.
         :param key: int
-        :param curr: Node
         :return: bool
         """
-        # Base case 1: Not found
-        if not curr:
-            return False
-        # Base case 2: Found it
-        if curr.key == key:
-            return True
-
-        # Recursive case
-        if curr.key > key:
-            return self._search_helper(key, curr.left)
-        else:
-            return self._search_helper(key, curr.right)
-        # T(n) = T(n/2) + O(1)
-        # a = 1, b = 2, d = 0
-        # According to Master Method, time: O(log n)
+        curr = self._root
+        while curr:
+            curr_key = curr.key
+            if curr_key == key:
+                # Found it
+                return True
+            if curr_key > key:
+                curr = curr.left
+            else:
+                curr = curr.right
+        # Not found
+        return False
+        # Time: O(log n)
 
     def insert(self, key: int) -> None:
         """
@@ -170,136 +177,166 @@ class AVLTree(object):
         :param key: int
         :return: None
         """
+        if not self._balanced:
+            self.rebalance_all()
         if not self._root:
             self._root = Node(key)
             return
-        self._root = self._insert_helper(key, [], self._root, is_lc=True)
-
-    def _insert_helper(self, key: int, path: List[Node], curr: Node,
-                       is_lc: bool) -> Node:
-        """
-        Private helper function to insert the given key to the given subtree
-        recursively.
+        self._path.clear()
+        self._insert_helper(key)
+
+    def insert_lazy(self, key: int) -> None:
+        """
+        Inserts the given key to the BST as a plain BST insertion, without
+        maintaining the heights or rebalancing.
+        This is meant for bulk insertions, after which the whole tree is rebuilt
+        once with rebalance_all(), rather than doing rotations on every
+        insertion.
+        Searching still works in the meantime, and the next insert() rebalances
+        the tree first.
         :param key: int
-        :param parent: list[Node]
-        :param curr: Node
-        :param is_lc: bool
-        :return: Node
+        :return: None
         """
-        # Base case 1: Found the spot to insert
-        if not curr:
-            parent = path[-1]
-            new_node = Node(key)
-            if is_lc:
-                parent.left = new_node
+        if not self._root:
+            self._root = Node(key)
+            return
+        curr = self._root
+        while True:
+            curr_key = curr.key
+            if curr_key == key:
+                # No duplicates allowed
+                return
+            if curr_key > key:
+                if not curr.left:
+                    curr.left = Node(key)
+                    break
+                curr = curr.left
             else:
-                parent.right = new_node
-            self._update_path_height(path)
-            return new_node
-        # Base case 2: Found it
-        if curr.key == key:
-            # No duplicates allowed
-            return curr
+                if not curr.right:
+                    curr.right = Node(key)
+                    break
+                curr = curr.right
+        self._balanced = False
+        # Time: O(h)
 
-        # Recursive case
-        path.append(curr)
-        if curr.key > key:
-            curr.left = self._insert_helper(key, path, curr.left, is_lc=True)
-        else:
-            curr.right = self._insert_helper(key, path, curr.right, is_lc=False)
-        # An insertion in the left or right subtree may break the balance of
-        # the current node.
-        return self._rebalance(curr, path)
-        # For insertion, there is at most one rebalancing operation when
-        # backtracking and rebalancing, since after rebalancing the first
-        # encountered unbalanced node when backtracking, all of its upper nodes
-        # remain balanced.
-        # T(n) = T(n/2) + O(1)
-        # a = 1, b = 2, d = 1
-        # According to Master Method, time: O(log n)
-
-    def _update_path_height(self, path: List[Node]) -> None:
+    def rebalance_all(self) -> None:
         """
-        Helper method to update the heights of the nodes along the path.
-        :param path: list[Node]
-        :return: Node
+        Rebuilds the whole tree into a perfectly balanced one, restoring the AVL
+        invariant after lazy insertions.
+        :return: None
         """
-        for node in reversed(path):
-            node.update_height()
+        keys = []
+        stack, curr = [], self._root
+        while stack or curr:
+            # Go all the way left, and then visit the node and go right
+            while curr:
+                stack.append(curr)
+                curr = curr.left
+            curr = stack.pop()
+            keys.append(curr.key)
+            curr = curr.right
+        self._root = self._build_balanced(keys, lo=0, hi=len(keys))
+        self._balanced = True
+        # Time: O(n)
+
+    def _insert_helper(self, key: int) -> None:
+        """
+        Private helper function to insert the given key to the BST iteratively.
+        The nodes along the way down are recorded in the path, which is then
+        used as the stack when backtracking.
+        :param key: int
+        :return: None
+        """
+        path = self._path
+        # Go down to find the spot to insert
+        curr = self._root
+        while curr:
+            curr_key = curr.key
+            if curr_key == key:
+                # No duplicates allowed
+                return
+            path.append(curr)
+            if curr_key > key:
+                curr = curr.left
+            else:
+                curr = curr.right
+        parent = path[-1]
+        if parent.key > key:
+            parent.left = Node(key)
+        else:
+            parent.right = Node(key)
+
+        # Backtrack along the path
+        while path:
+            curr = path.pop()
+            old_height = curr.height
+            curr.update_height()
+            if curr.height == old_height:
+                # The subtree rooted at the current node didn't grow, so the
+                # current node is still balanced, and all of its upper nodes
+                # keep their heights and balances.
+                return
+            # An insertion in the left or right subtree may break the balance of
+            # the current node.
+            new_root = self._rebalance(curr)
+            if new_root is not curr:
+                # Reconnect the rebalanced subtree to its parent
+                if not path:
+                    self._root = new_root
+                elif path[-1].left is curr:
+                    path[-1].left = new_root
+                else:
+                    path[-1].right = new_root
+                # For insertion, there is at most one rebalancing operation
+                # when backtracking, since after rebalancing the first
+                # encountered unbalanced node, the height of that subtree is
+                # restored, and thus all of its upper nodes remain balanced
+                # with unchanged heights.
+                return
         # Time: O(log n)
 
-    def _rebalance(self, curr: Node, path: List[Node]) -> Node:
+    def _rebalance(self, curr: Node) -> Node:
         """
         Helper function to rebalance the given node if it is unbalanced.
         :param curr: Node
-        :param path: list[Node]
         :return: Node
         """
-        balance = self._get_balance(curr)
+        # The balances are cached on the nodes, and the taller child of an
+        # unbalanced node always exists, so they can be read directly.
+        balance = curr.balance
+        if -1 <= balance <= 1:
+            # The insertion doesn't break the balance of the current node, which
+            # is by far the most common case when backtracking.
+            return curr
+
         # For detailed explanation, please refer to the tutorial
-        # "Left-left imbalance"
-        if balance > 1 and self._get_balance(curr.left) > 0:
+        # Only the taller child can be involved in the imbalance, so its balance
+        # is computed once to pick between the single and double rotations.
+        if balance > 1:
             # For the unbalanced node, the height of the left subtree is 2
-            # higher than the right subtree;
-            # for the left child, the height of the left subtree is 1 higher
-            # than the right subtree.
-            new_root = self._right_rotate(unbalanced=curr)
-            self._update_path_height(path)
-            return new_root
-        # "Right-right imbalance"
-        elif balance < -1 and self._get_balance(curr.right) < 0:
-            # For the unbalanced node, the height of the right subtree is 2
-            # higher than the left subtree;
-            # for the right child, the height of the right subtree is 1 higher
-            # than the left subtree.
-            new_root = self._left_rotate(unbalanced=curr)
-            self._update_path_height(path)
-            return new_root
-        # "Left-left imbalance"
-        elif balance > 1 and self._get_balance(curr.left) < 0:
-            # For the unbalanced node, the height of the left subtree is 2
-            # higher than the right subtree;
-            # for the left child, the height of the right subtree is 1 higher
-            # than the left subtree.
-
-            # First do a left rotation towards the left child, making the case a
-            # left-left imbalance
-            curr.left = self._left_rotate(unbalanced=curr.left)
-
+            # higher than the right subtree.
+            left = curr.left
+            if left.balance < 0:
+                # "Left-right imbalance"
+                # For the left child, the height of the right subtree is 1
+                # higher than the left subtree.
+                # First do a left rotation towards the left child, making the
+                # case a left-left imbalance
+                curr.left = self._left_rotate(unbalanced=left)
+            # "Left-left imbalance"
             new_root = self._right_rotate(unbalanced=curr)
-            self._update_path_height(path)
-            return new_root
-        # "Right-left imbalance"
-        elif balance < -1 and self._get_balance(curr.right) > 0:
+        else:
             # For the unbalanced node, the height of the right subtree is 2
-            # higher than the left subtree;
-            # for the right child, the height of the left subtree is 1 higher
-            # than the right subtree.
-
-            # First do a right rotation towards the right child, making the case
-            # a right-right imbalance
-            curr.right = self._right_rotate(unbalanced=curr.right)
-
+            # higher than the left subtree.
+            right = curr.right
+            if right.balance > 0:
+                # "Right-left imbalance"
+                # For the right child, the height of the left subtree is 1
+                # higher than the right subtree.
+                # First do a right rotation towards the right child, making the
+                # case a right-right imbalance
+                curr.right = self._right_rotate(unbalanced=right)
+            # "Right-right imbalance"
             new_root = self._left_rotate(unbalanced=curr)
-            self._update_path_height(new_root)
-            return new_root
-
-        # The insertion doesn't break the balance of the current node.
-        return curr
-        # Time: O(log n)
-
-    def _get_balance(self, node: Node) -> int:
-        """
-        Helper function to calculate the balance of the given node.
-        :param node: Node
-        :return: int
-        """
-        if not node:
-            return 0
-        left_height, right_height = 0, 0
-        if node.left:
-            left_height = node.left.height
-        if node.right:
-            right_height = node.right.height
-        return left_height - right_height
+        return new_root
         # Time: O(1)
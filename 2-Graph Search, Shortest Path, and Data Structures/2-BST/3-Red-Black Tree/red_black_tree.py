@@ -16,98 +16,22 @@ https://zhuanlan.zhihu.com/p/37470948
 
 __author__ = 'Ziang Lu'
 
+from typing import List
+
 
 class Node(object):
-    __slots__ = ['_key', '_parent', '_left', '_right', '_color']
+    __slots__ = ['key', 'left', 'right', 'color']
 
-    def __init__(self, key: int, parent, color: bool):
+    def __init__(self, key: int, color: bool):
         """
         Constructor with parameter.
         :param key: int
-        :param parent: Node
         :param color: boolean
         """
-        self._key = key
-        self._parent = parent
-        self._left = None
-        self._right = None
-        self._color = color
-
-    @property
-    def key(self) -> int:
-        """
-        Accessor of key.
-        :return: int
-        """
-        return self._key
-
-    @property
-    def parent(self):
-        """
-        Accessor of parent.
-        :return: Node
-        """
-        return self._parent
-
-    @property
-    def left(self):
-        """
-        Accessor of left.
-        :return: Node
-        """
-        return self._left
-
-    @property
-    def right(self):
-        """
-        Accessor of right.
-        :return: Node
-        """
-        return self._right
-
-    @property
-    def color(self) -> bool:
-        """
-        Accessor of color.
-        :return: None
-        """
-        return self._color
-
-    @parent.setter
-    def parent(self, parent) -> None:
-        """
-        Mutator of parent.
-        :param parent: Node
-        :return: None
-        """
-        self._parent = parent
-
-    @left.setter
-    def left(self, left) -> None:
-        """
-        Mutator of left.
-        :param left: Node
-        :return: None
-        """
-        self._left = left
-
-    @right.setter
-    def right(self, right) -> None:
-        """
-        Mutator of right.
-        :param right: Node
-        :return: None
-        """
-        self._right = right
-
-    @color.setter
-    def color(self, color: bool) -> None:
-        """
-        Mutator of color.
-        :param color: bool
-        :return: None
-        """
-        self._color = color
+        self.key = key
+        self.left = None
+        self.right = None
+        self.color = color
 
 
 class RedBlackTree(object):
@@ -122,37 +46,94 @@ class RedBlackTree(object):
         """
         self._root = None
 
-    def search(self, key: int) -> bool:
-        """
-        Searches for the given key in the Red-Black Tree.
-        :param key: int
-        :return: boolean
+    @classmethod
+    def from_sorted(cls, keys: List[int]):
+        """
+        Builds a Red-Black Tree from the given sorted keys in linear time,
+        without any rotation or recoloring.
+        (If the keys turn out to be unsorted, they are sorted first in
+        O(nlog n).)
+        Since splitting at the midpoint makes every root-null path have either
+        h or (h + 1) nodes, coloring only the nodes on the deepest level red
+        satisfies all the invariants.
+        :param keys: list[int]
+        :return: RedBlackTree
+        """
+        tree = cls()
+        # One linear pass drops the duplicates of sorted keys; unsorted keys
+        # fall back to sorting (O(nlog n))
+        unique_keys = []
+        for key in keys:
+            if unique_keys and key <= unique_keys[-1]:
+                if key < unique_keys[-1]:  # Unsorted after all
+                    unique_keys = sorted(set(keys))
+                    break
+                continue  # Duplicate
+            unique_keys.append(key)
+        if not unique_keys:
+            return tree
+        # Depth of the deepest level, where the root is at depth 0
+        max_depth = len(unique_keys).bit_length() - 1
+        tree._root = cls._build_balanced(
+            unique_keys, lo=0, hi=len(unique_keys), depth=0,
+            max_depth=max_depth
+        )
+        tree._root.color = cls.BLACK
+        return tree
+
+    @staticmethod
+    def _build_balanced(keys: List[int], lo: int, hi: int, depth: int,
+                        max_depth: int) -> Node:
+        """
+        Private helper function to build a perfectly balanced subtree from the
+        given sorted keys in [lo, hi) recursively.
+        :param keys: list[int]
+        :param lo: int
+        :param hi: int
+        :param depth: int
+        :param max_depth: int
+        :return: Node
         """
-        return self._search_helper(key, self._root)
+        # Base case
+        if lo >= hi:
+            return None
+        # Recursive case
+        mid = (lo + hi) // 2
+        if depth == max_depth:
+            color = RedBlackTree.RED
+        else:
+            color = RedBlackTree.BLACK
+        node = Node(keys[mid], color)
+        node.left = RedBlackTree._build_balanced(
+            keys, lo=lo, hi=mid, depth=depth + 1, max_depth=max_depth
+        )
+        node.right = RedBlackTree._build_balanced(
+            keys, lo=mid + 1, hi=hi, depth=depth + 1, max_depth=max_depth
+        )
+        return node
+        # T(n) = 2T(n/2) + O(1)
+        # a = 2, b = 2, d = 0
+        # According to Master Method, time: O(n)
 
-    def _search_helper(self, key: int, curr: Node) -> bool:
+    def search(self, key: int) -> bool:
         """
-        Private helper method to search for the given key in the given subtree
-        recursively.
+        Searches for the given key in the Red-Black Tree.
         :param key: int
-        :param curr: Node
         :return: boolean
         """
-        # Base case 1: Not found
-        if not curr:
-            return False
-        # Base case 2: Found it
-        if curr.key == key:
-            return True
-
-        # Recursive case
-        if curr.key > key:
-            return self._search_helper(key, curr.left)
-        else:
-            return self._search_helper(key, curr.right)
-        # T(n) = T(n/2) + O(1)
-        # a = 1, b = 2, d = 0
-        # According to Master Method, time: O(log n)
+        curr = self._root
+        while curr:
+            curr_key = curr.key
+            if curr_key == key:
+                # Found it
+                return True
+            if curr_key > key:
+                curr = curr.left
+            else:
+                curr = curr.right
+        # Not found
+        return False
+        # Time: O(log n)
 
     def insert(self, key: int) -> None:
         """
@@ -161,15 +142,14 @@ class RedBlackTree(object):
         :return: None
         """
         if not self._root:
-            self._root = Node(key, None, self.BLACK)
+            self._root = Node(key, self.BLACK)
             return
-        self._insert_helper(key, None, self._root, is_lc=True)
+        self._insert_helper(key)
 
-    def _insert_helper(self, key: int, parent: Node, curr: Node,
-                       is_lc: bool) -> None:
+    def _insert_helper(self, key: int) -> None:
         """
-        Private helper method to insert the given key to the given subtree
-        recursively.
+        Private helper method to insert the given key to the Red-Black Tree
+        iteratively.
         Insertion:
         1. Insert a new element as a normal BST (Might break invariants)
            Note that the newly inserted node is always red, since the
@@ -180,51 +160,58 @@ class RedBlackTree(object):
                  broken invariant #4, which is also more difficult to restore.
         2. Recolor and perform rotations until invariants are restored
         :param key: int
-        :param parent: Node
-        :param curr: Node
-        :param is_lc: boolean
         :return: None
         """
-        # Base case 1: Found the spot to insert
-        if not curr:
-            new_node = Node(key, parent, self.RED)
-            if is_lc:
-                parent.left = new_node
+        # Go down to find the spot to insert
+        # The nodes along the way down are recorded, so that the ancestors of
+        # the new node can be found when restoring the invariants without
+        # storing parent references in the nodes.
+        path = []
+        curr = self._root
+        while curr:
+            curr_key = curr.key
+            if curr_key == key:
+                # No duplicates allowed
+                return
+            path.append(curr)
+            if curr_key > key:
+                curr = curr.left
             else:
-                parent.right = new_node
-            # Restore the invariants
-            self._restore_invariants(to_restore=new_node)  # O(log n)
-            return
-        # Base case 2: Found it
-        if curr.key == key:
-            # No duplicates allowed
-            return
+                curr = curr.right
 
-        # Recursive case
-        if curr.key > key:
-            self._insert_helper(key, curr, curr.left, is_lc=True)
+        new_node = Node(key, self.RED)
+        parent = path[-1]
+        if parent.key > key:
+            parent.left = new_node
         else:
-            self._insert_helper(key, curr, curr.right, is_lc=False)
-        # T(n) = T(n/2) + O(1)
-        # a = 1, b = 2, d = 0
-        # According to Master Method, time: O(log n)
+            parent.right = new_node
+        # Restore the invariants
+        self._restore_invariants(to_restore=new_node, path=path)  # O(log n)
+        # Time: O(log n)
 
-    def _restore_invariants(self, to_restore: Node) -> None:
+    def _restore_invariants(self, to_restore: Node, path: List[Node]) -> None:
         """
-        Helper method to restore the invariants.
+        Helper method to restore the invariants iteratively.
         :param to_restore: Node
+        :param path: list[Node]
         :return: None
         """
-        parent = to_restore.parent
-        # Case 1: The parent is black.
-        if parent.color == self.BLACK:  # This won't violate invariant #3.
-            return
-
-        # Case 2: The parent is red.
-        if parent.color == self.RED:  # This violates invariant #3.
+        # The given path holds the ancestors of to_restore, from the root down
+        # to its parent.
+        while True:
+            parent = path[-1] if path else None
+            # Case 0: to_restore is the root.
+            # (It will be recolored to black below.)
+            # Case 1: The parent is black.
+            if not parent or parent.color == self.BLACK:  # This won't violate invariant #3.
+                break
+
+            # Case 2: The parent is red.  This violates invariant #3.
             # Then to_restore must have a grandparent, and it must be black
             # according to invariant #3.
-            grandparent = to_restore.parent.parent
+            grandparent = path[-2]
+            # Parent of the grandparent
+            great_grandparent = path[-3] if len(path) > 2 else None
             if parent is grandparent.left:
                 uncle = grandparent.right
                 if uncle and uncle.color == self.RED:  # Case 2.1: The uncle is red.
@@ -235,62 +222,73 @@ class RedBlackTree(object):
                     )
                     # In this way, the same case applies to the newly recolored
                     # grandparent.
-                    # Then we simply need to recurse towards grandparent.
-                    self._restore_invariants(to_restore=grandparent)
-                elif uncle and uncle.color == self.BLACK:  # Case 2.2: The uncle is black.
-                    if to_restore is parent.right:  # Case 2.2.1: to_restore is the right child.
-                        #         Black
-                        #        /    \
-                        #     Red    Black
-                        #       \
-                        #    Red (Curr)
-                        self._left_rotate(to_rotate=parent)
-                        # In this way, the same case applies to the newly left
-                        # rotated parent.
-                        # Then we simply need to recurse towards parent.
-                        self._restore_invariants(to_restore=parent)
-                    else:  # Case 2.2.2: to_restore is the left child.
-                        #         Black
-                        #        /    \
-                        #     Red    Black
-                        #     /
-                        # Red (Curr)
-                        # Recolor the parent to black, and the grandparent to
-                        # red
-                        parent.color = self.BLACK
-                        grandparent.color = self.RED
-                        self._right_rotate(to_rotate=grandparent)
+                    # Then we simply need to continue with grandparent.
+                    del path[-2:]
+                    to_restore = grandparent
+                    continue
+                # Case 2.2: The uncle is black (None counts as black).
+                if to_restore is parent.right:  # Case 2.2.1: to_restore is the right child.
+                    #         Black
+                    #        /    \
+                    #     Red    Black
+                    #       \
+                    #    Red (Curr)
+                    self._left_rotate(to_rotate=parent, parent=grandparent)
+                    # In this way, the same case applies to the newly left
+                    # rotated parent, whose parent is now to_restore.
+                    # Then we simply need to continue with parent.
+                    path[-1] = to_restore
+                    to_restore = parent
+                    continue
+                # Case 2.2.2: to_restore is the left child.
+                #         Black
+                #        /    \
+                #     Red    Black
+                #     /
+                # Red (Curr)
+                # Recolor the parent to black, and the grandparent to red
+                parent.color = self.BLACK
+                grandparent.color = self.RED
+                self._right_rotate(
+                    to_rotate=grandparent, parent=great_grandparent
+                )
+                break
             else:
                 uncle = grandparent.left
                 if uncle and uncle.color == self.RED:  # Case 2.1: The uncle is red.
                     self._restore_parent_and_uncle_are_red(
                         grandparent, parent, uncle
                     )
-                    self._restore_invariants(to_restore=grandparent)
-                elif uncle and uncle.color == self.BLACK:  # Case 2.2: The uncle is black.
-                    if to_restore is parent.left:  # Case 3.2.1: to_restore is the left child.
-                        #     Black
-                        #    /    \
-                        # Black   Red
-                        #         /
-                        #    Red (Curr)
-                        self._right_rotate(to_rotate=parent)
-                        # In this way, the same case applies to the newly  left
-                        # rotated parent.
-                        # Then we simply need to recurse towards parent.
-                        self._restore_invariants(to_restore=parent)
-                    else:
-                        # Case 3.2.2: to_restore is the right child
-                        #     Black
-                        #    /    \
-                        # Black   Red
-                        #           \
-                        #        Red (Curr)
-                        # Recolor the parent to black, and the grandparent to
-                        # red
-                        parent.color = self.BLACK
-                        grandparent.color = self.RED
-                        self._left_rotate(to_rotate=grandparent)
+                    del path[-2:]
+                    to_restore = grandparent
+                    continue
+                # Case 2.2: The uncle is black (None counts as black).
+                if to_restore is parent.left:  # Case 3.2.1: to_restore is the left child.
+                    #     Black
+                    #    /    \
+                    # Black   Red
+                    #         /
+                    #    Red (Curr)
+                    self._right_rotate(to_rotate=parent, parent=grandparent)
+                    # In this way, the same case applies to the newly right
+                    # rotated parent, whose parent is now to_restore.
+                    # Then we simply need to continue with parent.
+                    path[-1] = to_restore
+                    to_restore = parent
+                    continue
+                # Case 3.2.2: to_restore is the right child
+                #     Black
+                #    /    \
+                # Black   Red
+                #           \
+                #        Red (Curr)
+                # Recolor the parent to black, and the grandparent to red
+                parent.color = self.BLACK
+                grandparent.color = self.RED
+                self._left_rotate(
+                    to_rotate=grandparent, parent=great_grandparent
+                )
+                break
 
         # Recolor the root to black to ensure invariant #2
         self._root.color = self.BLACK
@@ -311,60 +309,50 @@ class RedBlackTree(object):
         uncle.color = self.BLACK
         # Time: O(1)
 
-    def _left_rotate(self, to_rotate: Node) -> None:
+    def _left_rotate(self, to_rotate: Node, parent: Node) -> None:
         """
-        Helper method to do a left rotation on the given node.
+        Helper method to do a left rotation on the given node, whose parent is
+        the given parent node (None if the given node is the root).
         :param to_rotate: Node
+        :param parent: Node
         :return: None
         """
-        # Temporarily store the parent and the right child
-        parent = to_rotate.parent
+        # Temporarily store the right child
         tmp = to_rotate.right
 
         # Reconnect the references to realize left rotation
         to_rotate.right = tmp.left
-        if tmp.left:
-            tmp.left.parent = to_rotate
-
         tmp.left = to_rotate
-        to_rotate.parent = tmp
 
         if parent:
             if to_rotate is parent.left:
                 parent.left = tmp
             else:
                 parent.right = tmp
-        tmp.parent = parent
-
-        if to_rotate is self._root:
-            self._root = to_rotate
+        else:
+            self._root = tmp
         # Time: O(1)
 
-    def _right_rotate(self, to_rotate: Node) -> None:
+    def _right_rotate(self, to_rotate: Node, parent: Node) -> None:
         """
-        Helper method to do a right rotation on the given node.
+        Helper method to do a right rotation on the given node, whose parent is
+        the given parent node (None if the given node is the root).
         :param to_rotate: Node
+        :param parent: Node
         :return: None
         """
-        # Temporarily store the parent and the left child
-        parent = to_rotate.parent
+        # Temporarily store the left child
         tmp = to_rotate.left
 
         # Reconnect the references to realize right rotation
         to_rotate.left = tmp.right
-        if tmp.right:
-            tmp.right.parent = to_rotate
-
         tmp.right = to_rotate
-        to_rotate.parent = tmp
 
         if parent:
             if to_rotate is parent.left:
                 parent.left = tmp
             else:
                 parent.right = tmp
-        tmp.parent = parent
-
-        if to_rotate is self._root:
-            self._root = to_rotate
+        else:
+            self._root = tmp
         # Time: O(1)
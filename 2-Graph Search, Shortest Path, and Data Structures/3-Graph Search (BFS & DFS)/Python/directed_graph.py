@@ -10,7 +10,7 @@ Note that parallel edges and self-loops are not allowed.
 __author__ = 'Ziang Lu'
 
 from collections import deque
-from typing import List
+from typing import List, ValuesView
 
 from graph_basics import AbstractGraph, AbstractVertex
 
@@ -23,8 +23,7 @@ class Vertex(AbstractVertex):
     __slots__ = [
         '_emissive_edges',
         '_emissive_neighbors',
-        '_incident_edges',
-        '_incident_neighbors'
+        '_incident_edges'
     ]
 
     def __init__(self, vtx_id: int):
@@ -33,10 +32,13 @@ class Vertex(AbstractVertex):
         :param vtx_id: int
         """
         super().__init__(vtx_id)
-        self._emissive_edges = []
-        self._emissive_neighbors = set()
-        self._incident_edges = []
-        self._incident_neighbors = set()
+        # Emissive edges indexed by the IDs of their heads
+        self._emissive_edges = {}
+        # Emissive neighbors indexed by their IDs, so that graph search can go
+        # directly to the neighbors
+        self._emissive_neighbors = {}
+        # Incident edges indexed by the IDs of their tails
+        self._incident_edges = {}
 
     def get_emissive_edge_with_head(self, head: AbstractVertex):
         """
@@ -48,19 +50,24 @@ class Vertex(AbstractVertex):
         if not head:
             raise IllegalArgumentError('The input head should not be None.')
 
-        for emissive_edge in self._emissive_edges:
-            if emissive_edge.head is head:
-                return emissive_edge
-        # Not found
-        return None
+        # Since parallel edges are not allowed, there is at most one such edge.
+        return self._emissive_edges.get(head.vtx_id)
 
     @property
-    def emissive_edges(self) -> list:
+    def emissive_edges(self) -> ValuesView:
         """
         Accessor of emissive_edges.
-        :return: list[DirectedEdge]
+        :return: ValuesView[DirectedEdge]
         """
-        return self._emissive_edges
+        return self._emissive_edges.values()
+
+    @property
+    def emissive_neighbors(self) -> ValuesView:
+        """
+        Accessor of emissive_neighbors.
+        :return: ValuesView[Vertex]
+        """
+        return self._emissive_neighbors.values()
 
     def get_incident_edge_with_tail(self, tail: AbstractVertex):
         """
@@ -72,19 +79,16 @@ class Vertex(AbstractVertex):
         if not tail:
             raise IllegalArgumentError('The input tail should not be None.')
 
-        for incident_edge in self._incident_edges:
-            if incident_edge.tail is tail:
-                return incident_edge
-        # Not found
-        return None
+        # Since parallel edges are not allowed, there is at most one such edge.
+        return self._incident_edges.get(tail.vtx_id)
 
     @property
-    def incident_edges(self) -> list:
+    def incident_edges(self) -> ValuesView:
         """
         Accessor of incident_edges.
-        :return: list[DirectedEdge]
+        :return: ValuesView[DirectedEdge]
         """
-        return self._incident_edges
+        return self._incident_edges.values()
 
     def add_emissive_edge(self, new_emissive_edge) -> None:
         """
@@ -104,11 +108,12 @@ class Vertex(AbstractVertex):
                 'tail.'
             )
         # Check whether the input emissive edge already exists
-        if new_emissive_edge.head.vtx_id in self._emissive_neighbors:
+        if new_emissive_edge.head.vtx_id in self._emissive_edges:
             raise IllegalArgumentError('The emissive edge already exists.')
 
-        self._emissive_edges.append(new_emissive_edge)
-        self._emissive_neighbors.add(new_emissive_edge.head.vtx_id)
+        self._emissive_edges[new_emissive_edge.head.vtx_id] = new_emissive_edge
+        self._emissive_neighbors[new_emissive_edge.head.vtx_id] = \
+            new_emissive_edge.head
 
     def add_incident_edge(self, new_incident_edge) -> None:
         """
@@ -128,11 +133,10 @@ class Vertex(AbstractVertex):
                 'head.'
             )
         # Check whether the input incident edge already exists
-        if new_incident_edge.tail.vtx_id in self._incident_neighbors:
+        if new_incident_edge.tail.vtx_id in self._incident_edges:
             raise IllegalArgumentError('The incident edge already exists.')
 
-        self._incident_edges.append(new_incident_edge)
-        self._incident_neighbors.add(new_incident_edge.tail.vtx_id)
+        self._incident_edges[new_incident_edge.tail.vtx_id] = new_incident_edge
 
     def remove_emissive_edge(self, emissive_edge_to_remove) -> None:
         """
@@ -152,13 +156,13 @@ class Vertex(AbstractVertex):
                 'tail.'
             )
         # Check whether the input emissive edge exists
-        if emissive_edge_to_remove.head.vtx_id not in self._emissive_neighbors:
+        if emissive_edge_to_remove.head.vtx_id not in self._emissive_edges:
             raise IllegalArgumentError(
                 "The emissive edge to remove doesn't exist."
             )
 
-        self._emissive_edges.remove(emissive_edge_to_remove)
-        self._emissive_neighbors.remove(emissive_edge_to_remove.head.vtx_id)
+        del self._emissive_edges[emissive_edge_to_remove.head.vtx_id]
+        del self._emissive_neighbors[emissive_edge_to_remove.head.vtx_id]
 
     def remove_incident_edge(self, incident_edge_to_remove) -> None:
         """
@@ -178,26 +182,28 @@ class Vertex(AbstractVertex):
                 'head.'
             )
         # Check whether the input incident edge exists
-        if incident_edge_to_remove.tail.vtx_id not in self._incident_neighbors:
+        if incident_edge_to_remove.tail.vtx_id not in self._incident_edges:
             raise IllegalArgumentError(
                 "The incident edge to remove doesn't exist."
             )
 
-        self._incident_edges.remove(incident_edge_to_remove)
-        self._incident_neighbors.remove(incident_edge_to_remove.tail.vtx_id)
+        del self._incident_edges[incident_edge_to_remove.tail.vtx_id]
 
     def __repr__(self):
         s = f'Vertex #{self._vtx_id}\n'
-        s += f'Its emissive neighbors: {self._emissive_neighbors}\n'
-        s += f'Its incident neighbors: {self._incident_neighbors}\n'
+        s += f'Its emissive neighbors: {set(self._emissive_edges)}\n'
+        s += f'Its incident neighbors: {set(self._incident_edges)}\n'
         return s
 
-    def __eq__(self, other):
-        return isinstance(other, Vertex) and self._vtx_id == other.vtx_id
+    # Since the vertex IDs are unique within a graph, equality is left as
+    # identity, so that list lookups compare vertices without calling back into
+    # Python.
+    def __hash__(self):
+        return self._vtx_id
 
 
 class DirectedEdge(object):
-    __slots__ = ['_tail', '_head']
+    __slots__ = ['_tail', '_head', '_graph_idx']
 
     def __init__(self, tail: Vertex, head: Vertex):
         """
@@ -207,6 +213,8 @@ class DirectedEdge(object):
         """
         self._tail = tail
         self._head = head
+        # Position of this edge in the edge list of the graph
+        self._graph_idx = -1
 
     @property
     def tail(self) -> Vertex:
@@ -262,16 +270,18 @@ class DirectedGraph(AbstractGraph):
 
         new_vtx = Vertex(new_vtx_id)
         self._vtx_list.append(new_vtx)
+        self._vtx_map[new_vtx_id] = new_vtx
 
     def _remove_vtx(self, vtx_to_remove):
         # Remove all the edges associated with the vertex to remove
         edges_to_remove = []
         edges_to_remove.extend(vtx_to_remove.emissive_edges)
         edges_to_remove.extend(vtx_to_remove.incident_edges)
-        while len(edges_to_remove):
-            self._remove_edge(edge_to_remove=edges_to_remove[0])
+        for edge_to_remove in edges_to_remove:
+            self._remove_edge(edge_to_remove=edge_to_remove)
         # Remove the vertex
         self._vtx_list.remove(vtx_to_remove)
+        del self._vtx_map[vtx_to_remove.vtx_id]
 
     def add_edge(self, tail_id, head_id):
         # Check whether the input endpoints both exist
@@ -291,6 +301,7 @@ class DirectedGraph(AbstractGraph):
         tail, head = new_edge.tail, new_edge.head
         tail.add_emissive_edge(new_edge)
         head.add_incident_edge(new_edge)
+        new_edge._graph_idx = len(self._edge_list)
         self._edge_list.append(new_edge)
 
     def remove_edge(self, tail_id, head_id):
@@ -309,7 +320,12 @@ class DirectedGraph(AbstractGraph):
         tail, head = edge_to_remove.tail, edge_to_remove.head
         tail.remove_emissive_edge(edge_to_remove)
         head.remove_incident_edge(edge_to_remove)
-        self._edge_list.remove(edge_to_remove)
+        # Swap the last edge into the position of the edge to remove
+        i = edge_to_remove._graph_idx
+        last_edge = self._edge_list.pop()
+        if i != len(self._edge_list):
+            self._edge_list[i] = last_edge
+            last_edge._graph_idx = i
 
     def bfs(self, src_vtx_id):
         # Check whether the input source vertex exists
@@ -330,12 +346,13 @@ class DirectedGraph(AbstractGraph):
             # (1) Take out the first vertex v
             vtx = queue.popleft()
             # (2) For every directed edge (v, w)
-            for edge in vtx.emissive_edges:
-                w = edge.head
+            # (The neighbors are read from the slot directly, skipping the
+            # property call for every visited vertex.)
+            for w in vtx._emissive_neighbors.values():
                 # If w is unexplored
-                if not w.explored:
+                if not w._explored:
                     # Mark w as explored
-                    w.set_as_explored()
+                    w._explored = True
 
                     findable_vtx_ids.append(w.vtx_id)
 
@@ -347,13 +364,18 @@ class DirectedGraph(AbstractGraph):
         # Check whether the input source and destination vertices both exist
         src_vtx, dest_vtx = self._find_vtx(src_vtx_id), \
             self._find_vtx(dest_vtx_id)
-        if not src_vtx:
+        if not src_vtx or not dest_vtx:
             raise IllegalArgumentError(
                 "The input source and destination vertices don't both exist."
             )
+        # The source vertex is trivially at distance 0 from itself.
+        if src_vtx is dest_vtx:
+            return 0
 
         # 1. Initialize G as s explored and other vertices unexplored
-        src_vtx.set_as_explored()
+        # The explored vertices and their layers are kept local to this search,
+        # so that no state is left behind on the vertices.
+        layers = {src_vtx_id: 0}
         # 2. Let Q be the queue of vertices initialized with s
         queue = deque()
         queue.append(src_vtx)
@@ -361,17 +383,15 @@ class DirectedGraph(AbstractGraph):
         while queue:
             # (1) Take out the first vertex v
             vtx = queue.popleft()
+            next_layer = layers[vtx.vtx_id] + 1
             # (2) For every directed edge (v, w)
-            for edge in vtx.emissive_edges:
-                w = edge.head
+            for w in vtx._emissive_neighbors.values():
                 # If w is unexplored
-                if not w.explored:
+                if w.vtx_id not in layers:
                     # Mark w as explored
-                    w.set_as_explored()
-
-                    w.layer = vtx.layer + 1
+                    layers[w.vtx_id] = next_layer
                     if w is dest_vtx:
-                        return dest_vtx.layer
+                        return next_layer
 
                     # Push w to Q
                     queue.append(w)
@@ -385,20 +405,27 @@ class DirectedGraph(AbstractGraph):
         return 0
 
     def _dfs_helper(self, vtx, findable_vtx_ids):
-        # For every directed edge (v, w)
-        for edge in vtx.emissive_edges:
-            w = edge.head
-            # If w is unexplored
-            # (This itself serves as a base case: all the w's of v are
-            # explored.)
-            if not w.explored:
-                # Mark w as explored
-                w.set_as_explored()
+        # Instead of recursion, keep an explicit stack of the vertices being
+        # searched, each with an iterator over its remaining emissive neighbors,
+        # so that long paths don't exceed the recursion limit
+        stack = [(vtx, iter(vtx._emissive_neighbors.values()))]
+        while stack:
+            v, neighbors = stack[-1]
+            # For every directed edge (v, w)
+            for w in neighbors:
+                # If w is unexplored
+                if not w._explored:
+                    # Mark w as explored
+                    w._explored = True
 
-                findable_vtx_ids.append(w.vtx_id)
+                    findable_vtx_ids.append(w.vtx_id)
 
-                # Do DFS on (G, w)   (Recursion)
-                self._dfs_helper(w, findable_vtx_ids=findable_vtx_ids)
+                    # Do DFS on (G, w)
+                    stack.append((w, iter(w._emissive_neighbors.values())))
+                    break
+            else:
+                # All the w's of v are explored.
+                stack.pop()
 
     def num_of_connected_components_with_dfs(self):
         # Directed connectivity
@@ -427,7 +454,8 @@ class DirectedGraph(AbstractGraph):
                 vtx.set_as_explored()
                 count += 1
                 # Do DFS towards v (Discovers precisely v's SCC)
-                self.dfs(vtx.vtx_id)
+                # (Go directly to the helper, since v is already at hand)
+                self._dfs_helper(vtx, findable_vtx_ids=[])
         return count
 
     def _get_vtxs_sorted_by_finish_time(self) -> List[Vertex]:
@@ -459,19 +487,23 @@ class DirectedGraph(AbstractGraph):
         :param vtxs_sorted_by_finish_time: list[Vertex]
         :return: None
         """
-        # For every edge (v, w)
-        for edge in vtx.emissive_edges:
-            w = edge.head
-            # If w is unexplored
-            if not w.explored:
-                # Mark w as explored
-                w.set_as_explored()
-                # Do DFS towards w
-                self._dfs_helper_with_finish_time(
-                    w, vtxs_sorted_by_finish_time=vtxs_sorted_by_finish_time
-                )
-        # Set v's finishing time
-        vtxs_sorted_by_finish_time.append(vtx)
+        # Same explicit stack as in _dfs_helper()
+        stack = [(vtx, iter(vtx._emissive_neighbors.values()))]
+        while stack:
+            v, neighbors = stack[-1]
+            # For every edge (v, w)
+            for w in neighbors:
+                # If w is unexplored
+                if not w._explored:
+                    # Mark w as explored
+                    w._explored = True
+                    # Do DFS towards w
+                    stack.append((w, iter(w._emissive_neighbors.values())))
+                    break
+            else:
+                stack.pop()
+                # Set v's finishing time
+                vtxs_sorted_by_finish_time.append(v)
 
     def topological_sort(self) -> List[int]:
         """
@@ -481,9 +513,7 @@ class DirectedGraph(AbstractGraph):
         """
         vtxs_sorted_by_finish_time = self._get_vtxs_sorted_by_finish_time()
 
-        return list(
-            reversed(list(map(lambda x: x.vtx_id, vtxs_sorted_by_finish_time)))
-        )
+        return [vtx.vtx_id for vtx in reversed(vtxs_sorted_by_finish_time)]
 
     def topological_sort_straightforward(self) -> List[int]:
         """
@@ -492,41 +522,27 @@ class DirectedGraph(AbstractGraph):
         :return: list[int]
         """
         topological_ordering = [0] * len(self._vtx_list)
-        self._topological_sort_straightforward_helper(
-            topological_ordering, curr_order=len(self._vtx_list)
+        curr_order = len(self._vtx_list)
+        # Instead of actually removing the sink vertices from the graph, keep
+        # track of the number of remaining emissive edges of every vertex, and
+        # a queue of the vertices that have become sink vertices
+        # (i.e., Kahn's algorithm, working backwards from the sink vertices)
+        out_degrees = {
+            vtx.vtx_id: len(vtx._emissive_edges) for vtx in self._vtx_list
+        }
+        sink_vtxs = deque(
+            vtx for vtx in self._vtx_list if not out_degrees[vtx.vtx_id]
         )
+        # Until no more sink vertices
+        while sink_vtxs:
+            sink_vtx = sink_vtxs.popleft()
+            topological_ordering[curr_order - 1] = sink_vtx.vtx_id
+            curr_order -= 1
+            # "Remove" the sink vertex: For every edge (v, sink)
+            for incident_edge in sink_vtx._incident_edges.values():
+                v = incident_edge.tail
+                out_degrees[v.vtx_id] -= 1
+                if not out_degrees[v.vtx_id]:
+                    sink_vtxs.append(v)
         return topological_ordering
-
-    def _topological_sort_straightforward_helper(
-        self, topological_ordering: List[int], curr_order: int
-    ) -> None:
-        """
-        Private helper function to fill in the given order of the topological
-        ordering using straightforward algorithm recursively.
-        :param topological_ordering: list[int]
-        :param curr_order: int
-        :return: None
-        """
-        # Base case 1: Finished ordering
-        if curr_order == 0:
-            return
-        sink_vtx = self._get_sink_vertex()
-        # Base case 2: No more sink vertices
-        if not sink_vtx:
-            return
-
-        # Recursive case
-        topological_ordering[curr_order - 1] = sink_vtx.vtx_id
-        self._remove_vtx(sink_vtx)
-        self._topological_sort_straightforward_helper(topological_ordering,
-                                                      curr_order=curr_order - 1)
-
-    def _get_sink_vertex(self) -> Vertex:
-        """
-        Helper function to get a sink vertex.
-        :return: Vertex
-        """
-        for vtx in self._vtx_list:
-            if not vtx.emissive_edges:
-                return vtx
-        return None
+        # Running time complexity: O(m + n)
@@ -12,7 +12,7 @@ class IllegalArgumentError(ValueError):
 
 
 class AbstractVertex(object):
-    __slots__ = ['_vtx_id', '_explored', '_layer']
+    __slots__ = ['_vtx_id', '_explored']
 
     def __init__(self, vtx_id: int):
         """
@@ -21,7 +21,6 @@ class AbstractVertex(object):
         """
         self._vtx_id = vtx_id
         self._explored = False
-        self._layer = 0
 
     @property
     def vtx_id(self) -> int:
@@ -39,14 +38,6 @@ class AbstractVertex(object):
         """
         return self._explored
 
-    @property
-    def layer(self) -> int:
-        """
-        Accessor of layer.
-        :return: int
-        """
-        return self._layer
-
     def set_as_explored(self) -> None:
         """
         Sets this vertex to explored.
@@ -61,24 +52,17 @@ class AbstractVertex(object):
         """
         self._explored = False
 
-    @layer.setter
-    def layer(self, layer: int) -> None:
-        """
-        Mutator of layer.
-        :param layer: int
-        :return: None
-        """
-        self._layer = layer
-
 
 class AbstractGraph(ABC):
-    __slots__ = ['_vtx_list', '_edge_list']
+    __slots__ = ['_vtx_list', '_vtx_map', '_edge_list']
 
     def __init__(self):
         """
         Default constructor.
         """
         self._vtx_list = []
+        # Index of the vertices by their IDs
+        self._vtx_map = {}
         self._edge_list = []
 
     @abstractmethod
@@ -96,11 +80,8 @@ class AbstractGraph(ABC):
         :param vtx_id: int
         :return: AbstractVertex
         """
-        for vtx in self._vtx_list:
-            if vtx.vtx_id == vtx_id:
-                return vtx
-        # Not found
-        return None
+        return self._vtx_map.get(vtx_id)
+        # Time: O(1)
 
     def remove_vtx(self, vtx_id: int) -> None:
         """
@@ -239,7 +220,7 @@ class AbstractGraph(ABC):
     def _dfs_helper(self, vtx, findable_vtx_ids: List[int]) -> None:
         """
         Private helper function to do DFS and find all the findable vertices
-        from the given vertex recursively.
+        from the given vertex.
         :param vtx: Vertex
         :param findable_vtx_ids: list[int]
         :return: None
@@ -10,6 +10,7 @@ Note that parallel edges and self-loops are not allowed.
 __author__ = 'Ziang Lu'
 
 from collections import deque
+from typing import List, ValuesView
 
 from graph_basics import AbstractGraph, AbstractVertex
 
@@ -28,7 +29,9 @@ class Vertex(AbstractVertex):
         """
         super().__init__(vtx_id)
         self._edges = []
-        self._neighbors = set()
+        # Neighbors indexed by their IDs, so that graph search can go directly
+        # to the neighbors
+        self._neighbors = {}
 
     def get_edge_with_neighbor(self, neighbor: AbstractVertex):
         """
@@ -55,6 +58,14 @@ class Vertex(AbstractVertex):
         """
         return self._edges
 
+    @property
+    def neighbors(self) -> ValuesView:
+        """
+        Accessor of neighbors.
+        :return: ValuesView[Vertex]
+        """
+        return self._neighbors.values()
+
     def add_edge(self, new_edge) -> None:
         """
         Adds the given edge to this vertex.
@@ -78,8 +89,12 @@ class Vertex(AbstractVertex):
         if neighbor.vtx_id in self._neighbors:
             raise IllegalArgumentError('The edge to add already exists.')
 
+        if new_edge.end1 is self:
+            new_edge._end1_idx = len(self._edges)
+        else:
+            new_edge._end2_idx = len(self._edges)
         self._edges.append(new_edge)
-        self._neighbors.add(neighbor.vtx_id)
+        self._neighbors[neighbor.vtx_id] = neighbor
 
     def remove_edge(self, edge_to_remove) -> None:
         """
@@ -105,15 +120,32 @@ class Vertex(AbstractVertex):
         if neighbor.vtx_id not in self._neighbors:
             raise IllegalArgumentError("The edge to remove doesn't exist.")
 
-        self._edges.remove(edge_to_remove)
-        self._neighbors.remove(neighbor.vtx_id)
+        # Swap the last edge into the position of the edge to remove
+        if edge_to_remove.end1 is self:
+            i = edge_to_remove._end1_idx
+        else:
+            i = edge_to_remove._end2_idx
+        last_edge = self._edges.pop()
+        if i != len(self._edges):
+            self._edges[i] = last_edge
+            if last_edge.end1 is self:
+                last_edge._end1_idx = i
+            else:
+                last_edge._end2_idx = i
+        del self._neighbors[neighbor.vtx_id]
 
     def __repr__(self):
-        return f'Vertex #{self._vtx_id}, Its neighbors: {self._neighbors}'
+        return f'Vertex #{self._vtx_id}, Its neighbors: {set(self._neighbors)}'
 
 
 class UndirectedEdge(object):
-    __slots__ = ['_end1', '_end2']
+    __slots__ = [
+        '_end1',
+        '_end2',
+        '_end1_idx',
+        '_end2_idx',
+        '_graph_idx'
+    ]
 
     def __init__(self, end1: Vertex, end2: Vertex):
         """
@@ -123,6 +155,11 @@ class UndirectedEdge(object):
         """
         self._end1 = end1
         self._end2 = end2
+        # Positions of this edge in the edges of its two endpoints, and in the
+        # edge list of the graph
+        self._end1_idx = -1
+        self._end2_idx = -1
+        self._graph_idx = -1
 
     @property
     def end1(self) -> Vertex:
@@ -178,6 +215,7 @@ class UndirectedGraph(AbstractGraph):
 
         new_vtx = Vertex(new_vtx_id)
         self._vtx_list.append(new_vtx)
+        self._vtx_map[new_vtx_id] = new_vtx
 
     def _remove_vtx(self, vtx_to_remove):
         # Remove all the edges associated with the vertex to remove
@@ -186,6 +224,7 @@ class UndirectedGraph(AbstractGraph):
             self._remove_edge(edge_to_remove=edges_to_remove[0])
         # Remove the vertex
         self._vtx_list.remove(vtx_to_remove)
+        del self._vtx_map[vtx_to_remove.vtx_id]
 
     def add_edge(self, end1_id, end2_id):
         # Check whether the input endpoints both exist
@@ -205,6 +244,7 @@ class UndirectedGraph(AbstractGraph):
         end1, end2 = new_edge.end1, new_edge.end2
         end1.add_edge(new_edge)
         end2.add_edge(new_edge)
+        new_edge._graph_idx = len(self._edge_list)
         self._edge_list.append(new_edge)
 
     def remove_edge(self, end1_id, end2_id):
@@ -224,7 +264,12 @@ class UndirectedGraph(AbstractGraph):
         end1, end2 = edge_to_remove.end1, edge_to_remove.end2
         end1.remove_edge(edge_to_remove)
         end2.remove_edge(edge_to_remove)
-        self._edge_list.remove(edge_to_remove)
+        # Swap the last edge into the position of the edge to remove
+        i = edge_to_remove._graph_idx
+        last_edge = self._edge_list.pop()
+        if i != len(self._edge_list):
+            self._edge_list[i] = last_edge
+            last_edge._graph_idx = i
 
     def bfs(self, src_vtx_id):
         # Check whether the input source vertex exists
@@ -234,44 +279,59 @@ class UndirectedGraph(AbstractGraph):
 
         # 1. Initialize G as s explored and other vertices unexplored
         src_vtx.set_as_explored()
+
+        findable_vtx_ids = [src_vtx_id]
+
+        self._bfs_helper(src_vtx, findable_vtx_ids=findable_vtx_ids)
+
+        return findable_vtx_ids
+
+    def _bfs_helper(self, src_vtx: Vertex,
+                    findable_vtx_ids: List[int]) -> None:
+        """
+        Private helper function to do BFS and find all the findable vertices
+        from the given explored source vertex.
+        :param src_vtx: Vertex
+        :param findable_vtx_ids: list[int]
+        :return: None
+        """
         # 2. Let Q be the queue of vertices initialized with s
         queue = deque()
         queue.append(src_vtx)
 
-        findable_vtx_ids = [src_vtx_id]
-
         # 3. While Q is not empty
         while queue:
             # (1) Take out the first vertex v
             vtx = queue.popleft()
             # (2) For every edge (v, w)
-            for edge in vtx.edges:
-                # Find the neighbor
-                if edge.end1 is vtx:  # endpoint2 is the neighbor.
-                    neighbor = edge.end2
-                else:  # endpoint1 is the neighbor.
-                    neighbor = edge.end1
+            # (The neighbors are read from the slot directly, without finding
+            # the other endpoint of every edge.)
+            for neighbor in vtx._neighbors.values():
                 # If w is unexplored
-                if not neighbor.explored:
+                if not neighbor._explored:
                     # Mark w as explored
-                    neighbor.set_as_explored()
+                    neighbor._explored = True
 
                     findable_vtx_ids.append(neighbor.vtx_id)
 
                     # Push w to Q
                     queue.append(neighbor)
-        return findable_vtx_ids
 
     def shortest_path(self, src_vtx_id, dest_vtx_id):
         # Check whether the input source and destination vertices both exist
         src_vtx, dest_vtx = self._find_vtx(src_vtx_id), \
             self._find_vtx(dest_vtx_id)
-        if not src_vtx:
+        if not src_vtx or not dest_vtx:
             raise IllegalArgumentError("The input source and destination "
                                        "vertices don't both exist.")
+        # The source vertex is trivially at distance 0 from itself.
+        if src_vtx is dest_vtx:
+            return 0
 
         # 1. Initialize G as s explored and other vertices unexplored
-        src_vtx.set_as_explored()
+        # The explored vertices and their layers are kept local to this search,
+        # so that no state is left behind on the vertices.
+        layers = {src_vtx_id: 0}
         # 2. Let Q be the queue of vertices initialized with s
         queue = deque()
         queue.append(src_vtx)
@@ -279,21 +339,15 @@ class UndirectedGraph(AbstractGraph):
         while queue:
             # (1) Take out the first vertex v
             vtx = queue.popleft()
+            next_layer = layers[vtx.vtx_id] + 1
             # (2) For every edge (v, w)
-            for edge in vtx.edges:
-                # Find the neighbor
-                if edge.end1 is vtx:  # endpoint2 is the neighbor.
-                    neighbor = edge.end2
-                else:  # endpoint1 is the neighbor.
-                    neighbor = edge.end1
+            for neighbor in vtx._neighbors.values():
                 # If w is unexplored
-                if not neighbor.explored:
+                if neighbor.vtx_id not in layers:
                     # Mark w as explored
-                    neighbor.set_as_explored()
-
-                    neighbor.layer = vtx.layer + 1
+                    layers[neighbor.vtx_id] = next_layer
                     if neighbor is dest_vtx:  # Found it
-                        return dest_vtx.layer
+                        return next_layer
 
                     # Push w to Q
                     queue.append(neighbor)
@@ -303,45 +357,58 @@ class UndirectedGraph(AbstractGraph):
 
     def num_of_connected_components_with_bfs(self):
         # Undirected connectivity
-        components = []
+        count = 0
         for vtx in self._vtx_list:
             # If v is unexplored (i.e., not explored from some previous BFS)
             if not vtx.explored:
+                # Mark v as explored
+                vtx.set_as_explored()
+                count += 1
                 # Do BFS towards v
                 # (Discovers precisely v's connected component)
-                component = self.bfs(vtx.vtx_id)
-                components.append(component)
-        return len(components)
+                # (Go directly to the helper, since v is already at hand, and
+                # only the number of components is needed)
+                self._bfs_helper(vtx, findable_vtx_ids=[])
+        return count
 
     def _dfs_helper(self, vtx, findable_vtx_ids):
-        # For every edge (v, w)
-        for edge in vtx.edges:
-            # Find the neighbor
-            if edge.end1 is vtx:  # endpoint2 is the neighbor.
-                neighbor = edge.end2
-            else:  # endpoint1 is the neighbor.
-                neighbor = edge.end1
-            # If w is unexplored
-            # (This itself serves as a base case: all the w's of v are
-            # explored.)
-            if not neighbor.explored:
-                # Mark w as explored
-                neighbor.set_as_explored()
-
-                findable_vtx_ids.append(neighbor.vtx_id)
-
-                # Do DFS on (G, w)   (Recursion)
-                self._dfs_helper(neighbor, findable_vtx_ids=findable_vtx_ids)
+        # Instead of recursion, keep an explicit stack of the vertices being
+        # searched, each with an iterator over its remaining neighbors, so that
+        # long paths don't exceed the recursion limit
+        stack = [(vtx, iter(vtx._neighbors.values()))]
+        while stack:
+            v, neighbors = stack[-1]
+            # For every edge (v, w)
+            for neighbor in neighbors:
+                # If w is unexplored
+                if not neighbor._explored:
+                    # Mark w as explored
+                    neighbor._explored = True
+
+                    findable_vtx_ids.append(neighbor.vtx_id)
+
+                    # Do DFS on (G, w)
+                    stack.append(
+                        (neighbor, iter(neighbor._neighbors.values()))
+                    )
+                    break
+            else:
+                # All the w's of v are explored.
+                stack.pop()
 
     def num_of_connected_components_with_dfs(self):
         # Undirected connectivity
-        components = []
+        count = 0
         # For every vertex v
         for vtx in self._vtx_list:
             # If v is unexplored (i.e., not explored from some previous DFS)
             if not vtx.explored:
+                # Mark v as explored
+                vtx.set_as_explored()
+                count += 1
                 # Do DFS towards v
                 # (Discovers precisely v's connected component)
-                component = self.dfs(vtx.vtx_id)
-                components.append(component)
-        return len(components)
+                # (Go directly to the helper, since v is already at hand, and
+                # only the number of components is needed)
+                self._dfs_helper(vtx, findable_vtx_ids=[])
+        return count
@@ -26,7 +26,8 @@ class IllegalArgumentError(ValueError):
 @total_ordering
 class Vertex(AbstractVertex, UnionFindObj):
     __slots__ = [
-        '_edges', '_neighbors', '_min_cost_incident_edge', '_min_incident_cost'
+        '_neighbors', '_adjacency', '_min_cost_incident_edge',
+        '_min_incident_cost', '_leader'
     ]
 
     DEFAULT_MIN_INCIDENT_COST = sys.maxsize
@@ -38,8 +39,10 @@ class Vertex(AbstractVertex, UnionFindObj):
         """
         AbstractVertex.__init__(self, vtx_id)
         UnionFindObj.__init__(self)
-        self._edges = []
         self._neighbors = set()
+        # (neighbor, edge) pairs, so that the algorithms don't need to find out
+        # which endpoint is the neighbor
+        self._adjacency = []
         self._min_cost_incident_edge = None
         self._min_incident_cost = Vertex.DEFAULT_MIN_INCIDENT_COST
 
@@ -53,20 +56,27 @@ class Vertex(AbstractVertex, UnionFindObj):
         if not neighbor:
             raise IllegalArgumentError('The input neighbor should not be None.')
 
-        for edge in self._edges:
-            if (edge.end1 is self and edge.end2 is neighbor) or \
-                    (edge.end1 is neighbor and edge.end2 is self):
+        for adjacent, edge in self._adjacency:
+            if adjacent is neighbor:
                 return edge
         # Not found
         return None
 
     @property
-    def edges(self) -> list:
+    def edges(self):
         """
         Accessor of edges.
-        :return: list[UndirectedEdge]
+        :return: iterator[UndirectedEdge]
         """
-        return self._edges
+        return (edge for _, edge in self._adjacency)
+
+    @property
+    def adjacency(self) -> list:
+        """
+        Accessor of adjacency.
+        :return: list[tuple(Vertex, UndirectedEdge)]
+        """
+        return self._adjacency
 
     @property
     def min_cost_incident_edge(self):
@@ -111,7 +121,11 @@ class Vertex(AbstractVertex, UnionFindObj):
         if neighbor.vtx_id in self._neighbors:
             raise IllegalArgumentError('The edge to add already exists.')
 
-        self._edges.append(new_edge)
+        if new_edge.end1 is self:
+            new_edge._end1_idx = len(self._adjacency)
+        else:
+            new_edge._end2_idx = len(self._adjacency)
+        self._adjacency.append((neighbor, new_edge))
         self._neighbors.add(neighbor.vtx_id)
 
     def remove_edge(self, edge_to_remove) -> None:
@@ -137,7 +151,18 @@ class Vertex(AbstractVertex, UnionFindObj):
         if neighbor.vtx_id not in self._neighbors:
             raise IllegalArgumentError("The edge to remove doesn't exist.")
 
-        self._edges.remove(edge_to_remove)
+        # Swap the last edge into the position of the edge to remove
+        if edge_to_remove.end1 is self:
+            i = edge_to_remove._end1_idx
+        else:
+            i = edge_to_remove._end2_idx
+        last_neighbor, last_edge = self._adjacency.pop()
+        if i != len(self._adjacency):
+            self._adjacency[i] = (last_neighbor, last_edge)
+            if last_edge.end1 is self:
+                last_edge._end1_idx = i
+            else:
+                last_edge._end2_idx = i
         self._neighbors.remove(neighbor.vtx_id)
 
     @min_cost_incident_edge.setter
@@ -167,7 +192,14 @@ class Vertex(AbstractVertex, UnionFindObj):
 
 @total_ordering
 class UndirectedEdge(object):
-    __slots__ = ['_end1', '_end2', '_cost']
+    __slots__ = [
+        '_end1',
+        '_end2',
+        '_cost',
+        '_end1_idx',
+        '_end2_idx',
+        '_graph_idx'
+    ]
 
     def __init__(self, end1: Vertex, end2: Vertex, cost: float):
         """
@@ -179,6 +211,11 @@ class UndirectedEdge(object):
         self._end1 = end1
         self._end2 = end2
         self._cost = cost
+        # Positions of this edge in the adjacency of its two endpoints, and in
+        # the edge list of the graph
+        self._end1_idx = -1
+        self._end2_idx = -1
+        self._graph_idx = -1
 
     @property
     def end1(self) -> Vertex:
@@ -245,14 +282,17 @@ class UndirectedGraph(AbstractGraph):
 
         new_vtx = Vertex(new_vtx_id)
         self._vtx_list.append(new_vtx)
+        self._vtx_map[new_vtx_id] = new_vtx
 
     def _remove_vtx(self, vtx_to_remove):
         # Remove all the edges associated with the vertex to remove
-        edges_to_remove = vtx_to_remove.edges
-        while len(edges_to_remove):
-            self._remove_edge(edge_to_remove=edges_to_remove[0])
+        adjacency = vtx_to_remove.adjacency
+        while adjacency:
+            _, edge_to_remove = adjacency[-1]
+            self._remove_edge(edge_to_remove=edge_to_remove)
         # Remove the vertex
         self._vtx_list.remove(vtx_to_remove)
+        del self._vtx_map[vtx_to_remove.vtx_id]
 
     def add_edge(self, end1_id, end2_id, cost):
         # Check whether the input endpoints both exist
@@ -272,6 +312,7 @@ class UndirectedGraph(AbstractGraph):
         end1, end2 = new_edge.end1, new_edge.end2
         end1.add_edge(new_edge)
         end2.add_edge(new_edge)
+        new_edge._graph_idx = len(self._edge_list)
         self._edge_list.append(new_edge)
 
     def remove_edge(self, end1_id, end2_id):
@@ -291,7 +332,12 @@ class UndirectedGraph(AbstractGraph):
         end1, end2 = edge_to_remove.end1, edge_to_remove.end2
         end1.remove_edge(edge_to_remove)
         end2.remove_edge(edge_to_remove)
-        self._edge_list.remove(edge_to_remove)
+        # Swap the last edge into the position of the edge to remove
+        i = edge_to_remove._graph_idx
+        last_edge = self._edge_list.pop()
+        if i != len(self._edge_list):
+            self._edge_list[i] = last_edge
+            last_edge._graph_idx = i
 
     def prim_mst_straightforward(self) -> float:
         """
@@ -330,12 +376,7 @@ class UndirectedGraph(AbstractGraph):
             spanned.add(w.vtx_id)
 
             # Update the crossing edges with w's edges if necessary
-            for w_edge in w.edges:
-                # Find the neighbor
-                if w_edge.end1.vtx_id == w.vtx_id:  # endpoint2 is the neighbor.
-                    neighbor = w_edge.end2
-                else:  # endpoint1 is the neighbor.
-                    neighbor = w_edge.end1
+            for neighbor, w_edge in w.adjacency:
                 # Check whether the neighbor of w has been spanned
                 if neighbor.vtx_id not in spanned:
                     heapq.heappush(crossing_edges, w_edge)
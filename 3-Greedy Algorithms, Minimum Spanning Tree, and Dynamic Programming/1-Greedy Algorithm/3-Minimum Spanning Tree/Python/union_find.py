@@ -19,7 +19,9 @@ class IllegalArgumentError(ValueError):
 
 
 class UnionFindObj(object):
-    __slots__ = ['_leader']
+    # '_leader' is declared by the subclasses instead, so that this class can
+    # be mixed into another class that has non-empty __slots__ (e.g., a vertex)
+    __slots__ = []
 
     def __init__(self):
         self._leader = self
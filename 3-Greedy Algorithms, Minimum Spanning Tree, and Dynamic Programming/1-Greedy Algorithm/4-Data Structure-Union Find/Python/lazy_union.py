@@ -120,6 +120,7 @@ class LazyUnionObj:
 
 
 class LazyUnion(object):
+    __slots__ = []
 
     @staticmethod
     def find(obj: LazyUnionObj):
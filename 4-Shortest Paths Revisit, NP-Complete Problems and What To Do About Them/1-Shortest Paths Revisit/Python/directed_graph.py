@@ -9,7 +9,7 @@ Note that parallel edges and self-loops are not allowed.
 
 __author__ = 'Ziang Lu'
 
-from typing import List
+from typing import List, ValuesView
 
 from graph_basics import AbstractEdge, AbstractGraph, AbstractVertex
 
@@ -21,9 +21,7 @@ class IllegalArgumentError(ValueError):
 class Vertex(AbstractVertex):
     __slots__ = [
         '_emissive_edges',
-        '_emissive_neighbors',
-        '_incident_edges',
-        '_incident_neighbors'
+        '_incident_edges'
     ]
 
     def __init__(self, vtx_id: int):
@@ -32,10 +30,10 @@ class Vertex(AbstractVertex):
         :param vtx_id: int
         """
         super().__init__(vtx_id)
-        self._emissive_edges = []
-        self._emissive_neighbors = set()
-        self._incident_edges = []
-        self._incident_neighbors = set()
+        # Emissive edges indexed by the IDs of their heads
+        self._emissive_edges = {}
+        # Incident edges indexed by the IDs of their tails
+        self._incident_edges = {}
 
     def get_emissive_edge_with_head(self, head: AbstractVertex) -> AbstractEdge:
         """
@@ -47,19 +45,16 @@ class Vertex(AbstractVertex):
         if not head:
             raise IllegalArgumentError('The input head should not be None.')
 
-        for emissive_edge in self._emissive_edges:
-            if emissive_edge.head is head:
-                return emissive_edge
-        # Not found
-        return None
+        # Since parallel edges are not allowed, there is at most one such edge.
+        return self._emissive_edges.get(head.vtx_id)
 
     @property
-    def emissive_edges(self) -> List[AbstractEdge]:
+    def emissive_edges(self) -> ValuesView[AbstractEdge]:
         """
         Accessor of emissive_edges.
-        :return: list[AbstractEdge]
+        :return: ValuesView[AbstractEdge]
         """
-        return self._emissive_edges
+        return self._emissive_edges.values()
 
     def get_incident_edge_with_tail(self, tail: AbstractVertex) -> AbstractEdge:
         """
@@ -71,19 +66,16 @@ class Vertex(AbstractVertex):
         if not tail:
             raise IllegalArgumentError('The input tail should not be None.')
 
-        for incident_edge in self._incident_edges:
-            if incident_edge.tail is tail:
-                return incident_edge
-        # Not found
-        return None
+        # Since parallel edges are not allowed, there is at most one such edge.
+        return self._incident_edges.get(tail.vtx_id)
 
     @property
-    def incident_edges(self) -> List[AbstractEdge]:
+    def incident_edges(self) -> ValuesView[AbstractEdge]:
         """
         Accessor of incident_edges.
-        :return: list[AbstractEdge]
+        :return: ValuesView[AbstractEdge]
         """
-        return self._incident_edges
+        return self._incident_edges.values()
 
     def add_emissive_edge(self, new_emissive_edge: AbstractEdge) -> None:
         """
@@ -103,11 +95,10 @@ class Vertex(AbstractVertex):
                 'tail.'
             )
         # Check whether the input emissive edge already exists
-        if new_emissive_edge.head.vtx_id in self._emissive_neighbors:
+        if new_emissive_edge.head.vtx_id in self._emissive_edges:
             raise IllegalArgumentError('The emissive edge already exists.')
 
-        self._emissive_edges.append(new_emissive_edge)
-        self._emissive_neighbors.add(new_emissive_edge.head.vtx_id)
+        self._emissive_edges[new_emissive_edge.head.vtx_id] = new_emissive_edge
 
     def add_incident_edge(self, new_incident_edge: AbstractEdge) -> None:
         """
@@ -127,11 +118,10 @@ class Vertex(AbstractVertex):
                 'head.'
             )
         # Check whether the input incident edge already exists
-        if new_incident_edge.tail.vtx_id in self._incident_neighbors:
+        if new_incident_edge.tail.vtx_id in self._incident_edges:
             raise IllegalArgumentError('The incident edge already exists.')
 
-        self._incident_edges.append(new_incident_edge)
-        self._incident_neighbors.add(new_incident_edge.tail.vtx_id)
+        self._incident_edges[new_incident_edge.tail.vtx_id] = new_incident_edge
 
     def remove_emissive_edge(self,
                              emissive_edge_to_remove: AbstractEdge) -> None:
@@ -151,13 +141,12 @@ class Vertex(AbstractVertex):
                 'The emissive edge to remove should involve this vertex as the '
                 'tail.')
         # Check whether the input emissive edge exists
-        if emissive_edge_to_remove.head.vtx_id not in self._emissive_neighbors:
+        if emissive_edge_to_remove.head.vtx_id not in self._emissive_edges:
             raise IllegalArgumentError(
                 "The emissive edge to remove doesn't exist."
             )
 
-        self._emissive_edges.remove(emissive_edge_to_remove)
-        self._emissive_neighbors.remove(emissive_edge_to_remove.head.vtx_id)
+        del self._emissive_edges[emissive_edge_to_remove.head.vtx_id]
 
     def remove_incident_edge(self,
                              incident_edge_to_remove: AbstractEdge) -> None:
@@ -177,26 +166,28 @@ class Vertex(AbstractVertex):
                 'The incident edge to remove should involve this vertex as the '
                 'head.')
         # Check whether the input incident edge exists
-        if incident_edge_to_remove.tail.vtx_id not in self._incident_neighbors:
+        if incident_edge_to_remove.tail.vtx_id not in self._incident_edges:
             raise IllegalArgumentError(
                 "The incident edge to remove doesn't exist."
             )
 
-        self._incident_edges.remove(incident_edge_to_remove)
-        self._incident_neighbors.remove(incident_edge_to_remove.tail.vtx_id)
+        del self._incident_edges[incident_edge_to_remove.tail.vtx_id]
 
     def __repr__(self):
         s = f'Vertex #{self._vtx_id}\n'
-        s += f'Its emissive neighbors: {self._emissive_neighbors}\n'
-        s += f'Its incident neighbors: {self._incident_neighbors}\n'
+        s += f'Its emissive neighbors: {set(self._emissive_edges)}\n'
+        s += f'Its incident neighbors: {set(self._incident_edges)}\n'
         return s
 
-    def __eq__(self, other):
-        return isinstance(other, Vertex) and self._vtx_id == other.vtx_id
+    # Since the vertex IDs are unique within a graph, equality is left as
+    # identity, so that list lookups compare vertices without calling back into
+    # Python.
+    def __hash__(self):
+        return self._vtx_id
 
 
 class DirectedEdge(AbstractEdge):
-    __slots__ = ['_tail', '_head']
+    __slots__ = ['_tail', '_head', '_graph_idx']
 
     def __init__(self, tail: Vertex, head: Vertex, length: int):
         """
@@ -208,6 +199,8 @@ class DirectedEdge(AbstractEdge):
         super().__init__(length)
         self._tail = tail
         self._head = head
+        # Position of this edge in the edge list of the graph
+        self._graph_idx = -1
 
     @property
     def tail(self) -> Vertex:
@@ -263,16 +256,18 @@ class DirectedGraph(AbstractGraph):
 
         new_vtx = Vertex(new_vtx_id)
         self._vtx_list.append(new_vtx)
+        self._vtx_map[new_vtx_id] = new_vtx
 
     def _remove_vtx(self, vtx_to_remove):
         # Remove all the edges associated with the vertex to remove
         edges_to_remove = []
         edges_to_remove.extend(vtx_to_remove.emissive_edges)
         edges_to_remove.extend(vtx_to_remove.incident_edges)
-        while len(edges_to_remove):
-            self._remove_edge(edge_to_remove=edges_to_remove[0])
+        for edge_to_remove in edges_to_remove:
+            self._remove_edge(edge_to_remove=edge_to_remove)
         # Remove the vertex
         self._vtx_list.remove(vtx_to_remove)
+        del self._vtx_map[vtx_to_remove.vtx_id]
 
     def add_edge(self, tail_id, head_id, length):
         # Check whether the input endpoints both exist
@@ -292,6 +287,7 @@ class DirectedGraph(AbstractGraph):
         tail, head = new_edge.tail, new_edge.head
         tail.add_emissive_edge(new_edge)
         head.add_incident_edge(new_edge)
+        new_edge._graph_idx = len(self._edge_list)
         self._edge_list.append(new_edge)
 
     def remove_edge(self, tail_id, head_id):
@@ -310,7 +306,12 @@ class DirectedGraph(AbstractGraph):
         tail, head = edge_to_remove.tail, edge_to_remove.head
         tail.remove_emissive_edge(edge_to_remove)
         head.remove_incident_edge(edge_to_remove)
-        self._edge_list.remove(edge_to_remove)
+        # Swap the last edge into the position of the edge to remove
+        i = edge_to_remove._graph_idx
+        last_edge = self._edge_list.pop()
+        if i != len(self._edge_list):
+            self._edge_list[i] = last_edge
+            last_edge._graph_idx = i
 
     def bellman_ford_shortest_paths(self, src_vtx_id):
         # Check whether the input source vertex exists
@@ -9,7 +9,7 @@ Note that parallel edges and self-loops are not allowed.
 
 __author__ = 'Ziang Lu'
 
-from typing import List
+from typing import Iterator, List, Tuple
 
 from graph_basics import AbstractEdge, AbstractGraph, AbstractVertex
 
@@ -19,7 +19,7 @@ class IllegalArgumentError(ValueError):
 
 
 class Vertex(AbstractVertex):
-    __slots__ = ['_edges', '_neighbors']
+    __slots__ = ['_neighbors', '_adjacency']
 
     def __init__(self, vtx_id: int):
         """
@@ -27,8 +27,10 @@ class Vertex(AbstractVertex):
         :param vtx_id: int
         """
         super().__init__(vtx_id)
-        self._edges = []
         self._neighbors = set()
+        # (neighbor, edge) pairs, so that the algorithms don't need to find out
+        # which endpoint is the neighbor
+        self._adjacency = []
 
     def get_edge_with_neighbor(self, neighbor: AbstractVertex) -> AbstractEdge:
         """
@@ -40,20 +42,27 @@ class Vertex(AbstractVertex):
         if not neighbor:
             raise IllegalArgumentError('The input neighbor should not be None.')
 
-        for edge in self._edges:
-            if (edge.end1 is self and edge.end2 is neighbor) or \
-                    (edge.end1 is neighbor and edge.end2 is self):
+        for adjacent, edge in self._adjacency:
+            if adjacent is neighbor:
                 return edge
         # Not found
         return None
 
     @property
-    def edges(self) -> List[AbstractEdge]:
+    def edges(self) -> Iterator[AbstractEdge]:
         """
         Accessor of edges.
-        :return: list[Edge]
+        :return: iterator[Edge]
         """
-        return self._edges
+        return (edge for _, edge in self._adjacency)
+
+    @property
+    def adjacency(self) -> List[Tuple[AbstractVertex, AbstractEdge]]:
+        """
+        Accessor of adjacency.
+        :return: list[tuple(Vertex, Edge)]
+        """
+        return self._adjacency
 
     def add_edge(self, new_edge: AbstractEdge) -> None:
         """
@@ -78,7 +87,11 @@ class Vertex(AbstractVertex):
         if neighbor.vtx_id in self._neighbors:
             raise IllegalArgumentError('The edge to add already exists.')
 
-        self._edges.append(new_edge)
+        if new_edge.end1 is self:
+            new_edge._end1_idx = len(self._adjacency)
+        else:
+            new_edge._end2_idx = len(self._adjacency)
+        self._adjacency.append((neighbor, new_edge))
         self._neighbors.add(neighbor.vtx_id)
 
     def remove_edge(self, edge_to_remove: AbstractEdge) -> None:
@@ -104,7 +117,18 @@ class Vertex(AbstractVertex):
         if neighbor.vtx_id not in self._neighbors:
             raise IllegalArgumentError("The edge to remove doesn't exist.")
 
-        self._edges.remove(edge_to_remove)
+        # Swap the last edge into the position of the edge to remove
+        if edge_to_remove.end1 is self:
+            i = edge_to_remove._end1_idx
+        else:
+            i = edge_to_remove._end2_idx
+        last_neighbor, last_edge = self._adjacency.pop()
+        if i != len(self._adjacency):
+            self._adjacency[i] = (last_neighbor, last_edge)
+            if last_edge.end1 is self:
+                last_edge._end1_idx = i
+            else:
+                last_edge._end2_idx = i
         self._neighbors.remove(neighbor.vtx_id)
 
     def __repr__(self):
@@ -112,7 +136,13 @@ class Vertex(AbstractVertex):
 
 
 class UndirectedEdge(AbstractEdge):
-    __slots__ = ['_end1', '_end2']
+    __slots__ = [
+        '_end1',
+        '_end2',
+        '_end1_idx',
+        '_end2_idx',
+        '_graph_idx'
+    ]
 
     def __init__(self, end1: Vertex, end2: Vertex, length: int):
         """
@@ -123,6 +153,11 @@ class UndirectedEdge(AbstractEdge):
         super().__init__(length)
         self._end1 = end1
         self._end2 = end2
+        # Positions of this edge in the adjacency of its two endpoints, and in
+        # the edge list of the graph
+        self._end1_idx = -1
+        self._end2_idx = -1
+        self._graph_idx = -1
 
     @property
     def end1(self) -> Vertex:
@@ -178,14 +213,17 @@ class UndirectedGraph(AbstractGraph):
 
         new_vtx = Vertex(new_vtx_id)
         self._vtx_list.append(new_vtx)
+        self._vtx_map[new_vtx_id] = new_vtx
 
     def _remove_vtx(self, vtx_to_remove):
         # Remove all the edges associated with the vertex to remove
-        edges_to_remove = vtx_to_remove.edges
-        while len(edges_to_remove):
-            self._remove_edge(edge_to_remove=edges_to_remove[0])
+        adjacency = vtx_to_remove.adjacency
+        while adjacency:
+            _, edge_to_remove = adjacency[-1]
+            self._remove_edge(edge_to_remove=edge_to_remove)
         # Remove the vertex
         self._vtx_list.remove(vtx_to_remove)
+        del self._vtx_map[vtx_to_remove.vtx_id]
 
     def add_edge(self, end1_id, end2_id, length):
         # Check whether the input endpoints both exist
@@ -205,6 +243,7 @@ class UndirectedGraph(AbstractGraph):
         end1, end2 = new_edge.end1, new_edge.end2
         end1.add_edge(new_edge)
         end2.add_edge(new_edge)
+        new_edge._graph_idx = len(self._edge_list)
         self._edge_list.append(new_edge)
 
     def remove_edge(self, end1_id, end2_id):
@@ -224,7 +263,12 @@ class UndirectedGraph(AbstractGraph):
         end1, end2 = edge_to_remove.end1, edge_to_remove.end2
         end1.remove_edge(edge_to_remove)
         end2.remove_edge(edge_to_remove)
-        self._edge_list.remove(edge_to_remove)
+        # Swap the last edge into the position of the edge to remove
+        i = edge_to_remove._graph_idx
+        last_edge = self._edge_list.pop()
+        if i != len(self._edge_list):
+            self._edge_list[i] = last_edge
+            last_edge._graph_idx = i
 
     def bellman_ford_shortest_paths(self, src_vtx_id):
         # Check whether the input source vertex exists
@@ -246,12 +290,7 @@ class UndirectedGraph(AbstractGraph):
                 min_path_length = subproblems[vtx.vtx_id][budget - 1]
                 # Case 2: P(s, v, i) has i edges (i.e., P doesn't use up all of
                 # its budget i.),
-                for edge in vtx.edges:
-                    # Find the neighbor
-                    if edge.end1 is vtx:  # endpoint2 is the neighbor.
-                        neighbor = edge.end2
-                    else:  # endpoint1 is the neighbor.
-                        neighbor = edge.end1
+                for neighbor, edge in vtx.adjacency:
                     # By plucking off the final hop (w, v), we form
                     # P(s, w, i - 1).
                     path_length = subproblems[neighbor.vtx_id][budget - 1] + \
@@ -268,12 +307,7 @@ class UndirectedGraph(AbstractGraph):
         made_update_in_extra_iter = False
         for vtx in self._vtx_list:
             min_path_length = subproblems[vtx.vtx_id][n - 1]
-            for edge in vtx.edges:
-                # Find the neighbor
-                if edge.end1 is vtx:  # endpoint2 is the neighbor.
-                    neighbor = edge.end2
-                else:  # endpoint1 is the neighbor.
-                    neighbor = edge.end1
+            for neighbor, edge in vtx.adjacency:
                 path_length = subproblems[neighbor.vtx_id][n - 1] + edge.length
                 if path_length < min_path_length:
                     min_path_length = path_length
@@ -347,12 +381,7 @@ class UndirectedGraph(AbstractGraph):
             for vtx in self._vtx_list:
                 min_path_length = prev_iter_dp[vtx.vtx_id]
                 penultimate_vtx = prev_iter_penultimate_vtxs[vtx.vtx_id]
-                for edge in vtx.edges:
-                    # Find the neighbor
-                    if edge.end1 is vtx:  # endpoint2 is the neighbor.
-                        neighbor = edge.end2
-                    else:  # endpoint1 is the neighbor.
-                        neighbor = edge.end1
+                for neighbor, edge in vtx.adjacency:
                     path_length = prev_iter_dp[neighbor.vtx_id] + edge.length
                     if path_length < min_path_length:
                         min_path_length = path_length
@@ -366,12 +395,7 @@ class UndirectedGraph(AbstractGraph):
         made_update_in_iter = False
         for vtx in self._vtx_list:
             min_path_length = prev_iter_dp[vtx.vtx_id]
-            for edge in vtx.edges:
-                # Find the neighbor
-                if edge.end1 is vtx:  # endpoint2 is the neighbor.
-                    neighbor = edge.end2
-                else:  # endpoint1 is the neighbor.
-                    neighbor = edge.end1
+            for neighbor, edge in vtx.adjacency:
                 path_length = prev_iter_dp[neighbor.vtx_id] + edge.length
                 if path_length < min_path_length:
                     min_path_length = path_length
@@ -410,12 +434,7 @@ class UndirectedGraph(AbstractGraph):
                 min_path_length = subproblems[vtx.vtx_id][budget - 1]
                 # Case 2: P(v, d, i) has exactly i edges (i.e., P uses up all of
                 # its budget i.), with first hop (v, w)
-                for edge in vtx.edges:
-                    # Find the neighbor
-                    if edge.end1 is vtx:  # endpoint2 is the neighbor.
-                        neighbor = edge.end2
-                    else:  # endpoint1 is the neighbor.
-                        neighbor = edge.end1
+                for neighbor, edge in vtx.adjacency:
                     # By plucking off the first hop (v, w), we form
                     # P'(w, d, i - 1).
                     path_length = subproblems[neighbor.vtx_id][budget - 1] + \
@@ -432,12 +451,7 @@ class UndirectedGraph(AbstractGraph):
         made_update_in_extra_iter = False
         for vtx in self._vtx_list:
             min_path_length = subproblems[vtx.vtx_id][n - 1]
-            for edge in vtx.edges:
-                # Find the neighbor
-                if edge.end1 is vtx:  # endpoint2 is the neighbor.
-                    neighbor = edge.end2
-                else:  # endpoint1 is the neighbor.
-                    neighbor = edge.end1
+            for neighbor, edge in vtx.adjacency:
                 path_length = subproblems[neighbor.vtx_id][n - 1] + edge.length
                 if path_length < min_path_length:
                     min_path_length = path_length
@@ -509,12 +523,7 @@ class UndirectedGraph(AbstractGraph):
             for vtx in self._vtx_list:
                 min_path_length = prev_iter_subproblems[vtx.vtx_id]
                 next_vtx = prev_iter_next_vtxs[vtx.vtx_id]
-                for edge in vtx.edges:
-                    # Find the neighbor
-                    if edge.end1 is vtx:  # endpoint2 is the neighbor.
-                        neighbor = edge.end2
-                    else:  # endpoint1 is the neighbor.
-                        neighbor = edge.end1
+                for neighbor, edge in vtx.adjacency:
                     path_length = prev_iter_subproblems[neighbor.vtx_id] + \
                         edge.length
                     if path_length < min_path_length:
@@ -529,12 +538,7 @@ class UndirectedGraph(AbstractGraph):
         made_update_in_iter = False
         for vtx in self._vtx_list:
             min_path_length = prev_iter_subproblems[vtx.vtx_id]
-            for edge in vtx.edges:
-                # Find the neighbor
-                if edge.end1 is vtx:  # endpoint2 is the neighbor.
-                    neighbor = edge.end2
-                else:  # endpoint1 is the neighbor.
-                    neighbor = edge.end1
+            for neighbor, edge in vtx.adjacency:
                 path_length = prev_iter_subproblems[neighbor.vtx_id] + \
                     edge.length
                 if path_length < min_path_length:
@@ -50,7 +50,7 @@ class AbstractEdge(object):
 
 
 class AbstractGraph(ABC):
-    __slots__ = ['_vtx_list', '_edge_list']
+    __slots__ = ['_vtx_list', '_vtx_map', '_edge_list']
 
     _INFINITY = 1000000
 
@@ -59,6 +59,8 @@ class AbstractGraph(ABC):
         Default constructor.
         """
         self._vtx_list = []
+        # Index of the vertices by their IDs
+        self._vtx_map = {}
         self._edge_list = []
 
     @abstractmethod
@@ -76,11 +78,8 @@ class AbstractGraph(ABC):
         :param vtx_id: int
         :return: AbstractVertex
         """
-        for vtx in self._vtx_list:
-            if vtx.vtx_id == vtx_id:
-                return vtx
-        # Not found
-        return None
+        return self._vtx_map.get(vtx_id)
+        # Time: O(1)
 
     def remove_vtx(self, vtx_id: int) -> None:
         """
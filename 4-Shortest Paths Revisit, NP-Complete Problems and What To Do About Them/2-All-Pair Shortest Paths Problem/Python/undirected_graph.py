@@ -79,6 +79,10 @@ class Vertex(AbstractVertex):
         if neighbor.vtx_id in self._neighbors:
             raise IllegalArgumentError('The edge to add already exists.')
 
+        if new_edge.end1 is self:
+            new_edge._end1_idx = len(self._edges)
+        else:
+            new_edge._end2_idx = len(self._edges)
         self._edges.append(new_edge)
         self._neighbors.add(neighbor.vtx_id)
 
@@ -106,7 +110,18 @@ class Vertex(AbstractVertex):
         if neighbor.vtx_id not in self._neighbors:
             raise IllegalArgumentError("The edge to remove doesn't exist.")
 
-        self._edges.remove(edge_to_remove)
+        # Swap the last edge into the position of the edge to remove
+        if edge_to_remove.end1 is self:
+            i = edge_to_remove._end1_idx
+        else:
+            i = edge_to_remove._end2_idx
+        last_edge = self._edges.pop()
+        if i != len(self._edges):
+            self._edges[i] = last_edge
+            if last_edge.end1 is self:
+                last_edge._end1_idx = i
+            else:
+                last_edge._end2_idx = i
         self._neighbors.remove(neighbor.vtx_id)
 
     def __repr__(self):
@@ -114,7 +129,13 @@ class Vertex(AbstractVertex):
 
 
 class UndirectedEdge(AbstractEdge):
-    __slots__ = ['_end1', '_end2']
+    __slots__ = [
+        '_end1',
+        '_end2',
+        '_end1_idx',
+        '_end2_idx',
+        '_graph_idx'
+    ]
 
     def __init__(self, end1: Vertex, end2: Vertex, length: int):
         """
@@ -126,6 +147,11 @@ class UndirectedEdge(AbstractEdge):
         super().__init__(length)
         self._end1 = end1
         self._end2 = end2
+        # Positions of this edge in the edges of its two endpoints, and in the
+        # edge list of the graph
+        self._end1_idx = -1
+        self._end2_idx = -1
+        self._graph_idx = -1
 
     @property
     def end1(self) -> Vertex:
@@ -181,6 +207,7 @@ class UndirectedGraph(AbstractGraph):
 
         new_vtx = Vertex(new_vtx_id)
         self._vtx_list.append(new_vtx)
+        self._vtx_map[new_vtx_id] = new_vtx
 
     def _remove_vtx(self, vtx_to_remove):
         # Remove all the edges associated with the vertex to remove
@@ -189,6 +216,7 @@ class UndirectedGraph(AbstractGraph):
             self._remove_edge(edge_to_remove=edges_to_remove[0])
         # Remove the vertex
         self._vtx_list.remove(vtx_to_remove)
+        del self._vtx_map[vtx_to_remove.vtx_id]
 
     def add_edge(self, end1_id, end2_id, length):
         # Check whether the input endpoints both exist
@@ -208,6 +236,7 @@ class UndirectedGraph(AbstractGraph):
         end1, end2 = new_edge.end1, new_edge.end2
         end1.add_edge(new_edge)
         end2.add_edge(new_edge)
+        new_edge._graph_idx = len(self._edge_list)
         self._edge_list.append(new_edge)
 
     def remove_edge(self, end1_id, end2_id):
@@ -227,7 +256,12 @@ class UndirectedGraph(AbstractGraph):
         end1, end2 = edge_to_remove.end1, edge_to_remove.end2
         end1.remove_edge(edge_to_remove)
         end2.remove_edge(edge_to_remove)
-        self._edge_list.remove(edge_to_remove)
+        # Swap the last edge into the position of the edge to remove
+        i = edge_to_remove._graph_idx
+        last_edge = self._edge_list.pop()
+        if i != len(self._edge_list):
+            self._edge_list[i] = last_edge
+            last_edge._graph_idx = i
 
     def floyd_warshall_apsp(self):
         n = len(self._vtx_list)
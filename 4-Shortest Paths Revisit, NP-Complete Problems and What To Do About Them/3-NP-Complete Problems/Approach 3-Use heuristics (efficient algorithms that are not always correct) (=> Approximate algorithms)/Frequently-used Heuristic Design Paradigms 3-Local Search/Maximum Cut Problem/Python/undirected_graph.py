@@ -19,7 +19,7 @@ class IllegalArgumentError(ValueError):
 
 
 class Vertex(AbstractVertex):
-    __slots__ = ['_edges', '_neighbors']
+    __slots__ = ['_neighbors', '_adjacency']
 
     def __init__(self, vtx_id: int):
         """
@@ -27,8 +27,10 @@ class Vertex(AbstractVertex):
         :param vtx_id: int
         """
         super().__init__(vtx_id)
-        self._edges = []
         self._neighbors = set()
+        # (neighbor, edge) pairs, so that the algorithms don't need to find out
+        # which endpoint is the neighbor
+        self._adjacency = []
 
     def get_edge_with_neighbor(self, neighbor: AbstractVertex):
         """
@@ -40,20 +42,27 @@ class Vertex(AbstractVertex):
         if not neighbor:
             raise IllegalArgumentError('The input neighbor should not be None.')
 
-        for edge in self._edges:
-            if (edge.end1 is self and edge.end2 is neighbor) or \
-                    (edge.end1 is neighbor and edge.end2 is self):
+        for adjacent, edge in self._adjacency:
+            if adjacent is neighbor:
                 return edge
         # Not found
         return None
 
     @property
-    def edges(self) -> list:
+    def edges(self):
         """
         Accessor of edges.
-        :return: list[Edge]
+        :return: iterator[Edge]
         """
-        return self._edges
+        return (edge for _, edge in self._adjacency)
+
+    @property
+    def adjacency(self):
+        """
+        Accessor of adjacency.
+        :return: list[tuple(Vertex, Edge)]
+        """
+        return self._adjacency
 
     def add_edge(self, new_edge) -> None:
         """
@@ -79,7 +88,11 @@ class Vertex(AbstractVertex):
         if neighbor.vtx_id in self._neighbors:
             raise IllegalArgumentError('The edge to add already exists.')
 
-        self._edges.append(new_edge)
+        if new_edge.end1 is self:
+            new_edge._end1_idx = len(self._adjacency)
+        else:
+            new_edge._end2_idx = len(self._adjacency)
+        self._adjacency.append((neighbor, new_edge))
         self._neighbors.add(neighbor.vtx_id)
 
     def remove_edge(self, edge_to_remove) -> None:
@@ -106,7 +119,18 @@ class Vertex(AbstractVertex):
         if neighbor.vtx_id not in self._neighbors:
             raise IllegalArgumentError("The edge to remove doesn't exist.")
 
-        self._edges.remove(edge_to_remove)
+        # Swap the last edge into the position of the edge to remove
+        if edge_to_remove.end1 is self:
+            i = edge_to_remove._end1_idx
+        else:
+            i = edge_to_remove._end2_idx
+        last_neighbor, last_edge = self._adjacency.pop()
+        if i != len(self._adjacency):
+            self._adjacency[i] = (last_neighbor, last_edge)
+            if last_edge.end1 is self:
+                last_edge._end1_idx = i
+            else:
+                last_edge._end2_idx = i
         self._neighbors.remove(neighbor.vtx_id)
 
     def __repr__(self):
@@ -114,7 +138,13 @@ class Vertex(AbstractVertex):
 
 
 class UndirectedEdge(object):
-    __slots__ = ['_end1', '_end2']
+    __slots__ = [
+        '_end1',
+        '_end2',
+        '_end1_idx',
+        '_end2_idx',
+        '_graph_idx'
+    ]
 
     def __init__(self, end1: Vertex, end2: Vertex):
         """
@@ -124,6 +154,11 @@ class UndirectedEdge(object):
         """
         self._end1 = end1
         self._end2 = end2
+        # Positions of this edge in the adjacency of its two endpoints, and in
+        # the edge list of the graph
+        self._end1_idx = -1
+        self._end2_idx = -1
+        self._graph_idx = -1
 
     @property
     def end1(self) -> Vertex:
@@ -181,14 +216,17 @@ class UndirectedGraph(AbstractGraph):
 
         new_vtx = Vertex(new_vtx_id)
         self._vtx_list.append(new_vtx)
+        self._vtx_map[new_vtx_id] = new_vtx
 
     def _remove_vtx(self, vtx_to_remove):
         # Remove all the edges associated with the vertex to remove
-        edges_to_remove = vtx_to_remove.edges
-        while len(edges_to_remove):
-            self._remove_edge(edge_to_remove=edges_to_remove[0])
+        adjacency = vtx_to_remove.adjacency
+        while adjacency:
+            _, edge_to_remove = adjacency[-1]
+            self._remove_edge(edge_to_remove=edge_to_remove)
         # Remove the vertex
         self._vtx_list.remove(vtx_to_remove)
+        del self._vtx_map[vtx_to_remove.vtx_id]
 
     def add_edge(self, end1_id, end2_id, length):
         # Check whether the input endpoints both exist
@@ -208,6 +246,7 @@ class UndirectedGraph(AbstractGraph):
         end1, end2 = new_edge.end1, new_edge.end2
         end1.add_edge(new_edge)
         end2.add_edge(new_edge)
+        new_edge._graph_idx = len(self._edge_list)
         self._edge_list.append(new_edge)
 
     def remove_edge(self, end1_id, end2_id):
@@ -227,7 +266,12 @@ class UndirectedGraph(AbstractGraph):
         end1, end2 = edge_to_remove.end1, edge_to_remove.end2
         end1.remove_edge(edge_to_remove)
         end2.remove_edge(edge_to_remove)
-        self._edge_list.remove(edge_to_remove)
+        # Swap the last edge into the position of the edge to remove
+        i = edge_to_remove._graph_idx
+        last_edge = self._edge_list.pop()
+        if i != len(self._edge_list):
+            self._edge_list[i] = last_edge
+            last_edge._graph_idx = i
 
     def compute_maximum_cut(self):
         # Always maintain a candidate cut, and iteratively make it better and
@@ -253,12 +297,7 @@ class UndirectedGraph(AbstractGraph):
             # 2. While there is a vertex v with more internal edges than
             # crossing edges
             dv, cv = 0, 0
-            for edge in vtx.edges:
-                # Find the neighbor
-                if edge.end1 is vtx:  # endpoint2 is the neighbor.
-                    neighbor = edge.end2
-                else:  # endpoint1 is the neighbor.
-                    neighbor = edge.end1
+            for neighbor, _ in vtx.adjacency:
                 if vtx.vtx_id in group1 and neighbor.vtx_id in group2 \
                         or vtx.vtx_id not in group1 \
                         and neighbor.vtx_id not in group2: